@@ -1,51 +1,99 @@
 #!/usr/bin/env python3
+# Developer tool: src/advanced_app.py already ships with create_encoding_script
+# and run_encoding, so this only rewrites the file when run with --apply.
 
+import argparse
+import ast
 import os
 import sys
-import inspect
+from pathlib import Path
+
+parser = argparse.ArgumentParser(description="Add missing encoding helpers to src/advanced_app.py")
+parser.add_argument('--apply', action='store_true', help='Write the patched file instead of only checking it')
+args = parser.parse_args()
+
+# Resolve the script directory once and reuse it for every path below
+HERE = os.path.dirname(os.path.realpath(__file__))
 
 # Find where advanced_app.py is
-app_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "src", "advanced_app.py")
+app_path = os.path.join(HERE, "src", "advanced_app.py")
 print(f"Looking for app at: {app_path}")
-print(f"File exists: {os.path.exists(app_path)}")
 
-# Load the file contents
-with open(app_path, 'r') as f:
-    content = f.read()
+# Skip the read entirely if the file hasn't changed since the last successful run
+stamp_path = os.path.join(HERE, ".create_fix.stamp")
+
+def file_stamp(path):
+    """Return an mtime/size key identifying the current state of a file"""
+    st = os.stat(path)
+    return f"{st.st_mtime_ns}:{st.st_size}"
+
+try:
+    with open(stamp_path, 'r') as f:
+        if f.read().strip() == file_stamp(app_path):
+            print("File already patched")
+            sys.exit(0)
+except OSError:
+    pass
+
+# Load the file contents in a single read and parse it once
+try:
+    source = Path(app_path).read_bytes()
+except FileNotFoundError:
+    print(f"Missing: {app_path}")
+    sys.exit(1)
+tree = ast.parse(source)
+
+# Map top-level function names to their line numbers
+top_level_functions = {node.name: node.lineno for node in tree.body if isinstance(node, ast.FunctionDef)}
 
 # Check if create_encoding_script exists
-if "def create_encoding_script" in content:
+if "create_encoding_script" in top_level_functions:
     print("Function already exists in the file")
+    patched = True
 else:
     print("Function doesn't exist, will need to add it")
 
     # Find a good insert position - just before show_help function
-    insert_pos = content.find("def show_help")
-    if insert_pos > 0:
+    insert_lineno = top_level_functions.get("show_help")
+    if not args.apply:
+        print("Run with --apply to add it")
+        sys.exit(1)
+    elif insert_lineno is not None:
         # Prepare the new function
         new_function = """
+ENCODE_SCRIPT_PATH = os.path.join(os.path.dirname(os.path.realpath(__file__)), "run_encode.py")
+
 def create_encoding_script(slideshow_title, resolution, quality, output_filename, encoder, audio_file, image_list, slide_duration):
     \"\"\"Create an encoding script file with the provided slideshow settings.\"\"\"
     print(f"Creating encoding script with: {slideshow_title}, {resolution}, {quality}, {output_filename}")
     # Create the actual run_encode.py script
-    return os.path.join(os.path.dirname(os.path.realpath(__file__)), "run_encode.py")
+    return ENCODE_SCRIPT_PATH
 
 def run_encoding():
     \"\"\"Run the encoding script with progress monitoring.\"\"\"
-    script_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "run_encode.py")
-    print(f"Would run encoding using: {script_path}")
+    print(f"Would run encoding using: {ENCODE_SCRIPT_PATH}")
     return True
 
 """
         # Insert the new function
-        new_content = content[:insert_pos] + new_function + content[insert_pos:]
-        
-        # Write back to file
-        with open(app_path, 'w') as f:
-            f.write(new_content)
-        
+        lines = source.decode("utf-8").splitlines(keepends=True)
+        new_content = "".join(lines[:insert_lineno - 1]) + new_function + "".join(lines[insert_lineno - 1:])
+
+        # Write to a temporary file and swap it in atomically
+        tmp_path = app_path + ".tmp"
+        with open(tmp_path, 'wb', buffering=1 << 20) as f:
+            f.write(new_content.encode("utf-8"))
+        os.replace(tmp_path, app_path)
+
         print(f"Added the create_encoding_script and run_encoding functions to {app_path}")
+        patched = True
     else:
         print("Couldn't find a good place to insert the function")
+        patched = False
+
+# Remember the patched state so later runs can skip the read
+if patched:
+    with open(stamp_path, 'w') as f:
+        f.write(file_stamp(app_path))
 
-print("Script completed") 
\ No newline at end of file
+print("Script completed")
@@ -6,26 +6,72 @@ import os
 import sys
 import time
 import shutil
+import signal
 import platform
 import subprocess
+import importlib.util
+import threading
+import itertools
+import io
+import contextlib
 import argparse
 import json
+import getpass
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime
+from functools import lru_cache
+from collections import Counter, defaultdict
 import re
-import glob
-from collections import defaultdict
-import math
+
+# psutil is optional; it is only imported once hardware details are needed
+HAVE_PSUTIL = importlib.util.find_spec("psutil") is not None
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+try:
+    from tinytag import TinyTag
+    HAVE_TINYTAG = True
+except ImportError:
+    HAVE_TINYTAG = False
+
+# Single-key reads: termios/tty on POSIX, msvcrt on Windows
+try:
+    import termios
+    import tty
+    HAVE_TERMIOS = True
+except ImportError:
+    HAVE_TERMIOS = False
 
 try:
-    import psutil
-    HAVE_PSUTIL = True
+    import msvcrt
+    HAVE_MSVCRT = True
 except ImportError:
-    HAVE_PSUTIL = False
+    HAVE_MSVCRT = False
 
 # Constants
 VERSION = "2.5.0"
 PROGRAM_NAME = "SlideSonic (2025)"
 
+# Banner text, shared by the colored and plain banners
+BANNER_TITLE = "SlideSonic"
+BANNER_SUBTITLE = "Create stunning slideshow videos"
+BANNER_CREDIT = f"Version {VERSION} | Chamath Thiwanka (CHX)"
+GITHUB_URL = "https://github.com/chama-x/SlideSonic-2025"
+
+# Files that live next to this script (resolved once at import)
+_MODULE_DIR = os.path.dirname(os.path.realpath(__file__))
+_SETTINGS_PATH = os.path.join(_MODULE_DIR, "settings.json")
+_RUN_ENCODE_PATH = os.path.join(_MODULE_DIR, "run_encode.py")
+_MONITOR_PATH = os.path.join(_MODULE_DIR, "monitor_encoding.py")
+
+# Settings handed to run_encode.py and its console log (relative to the project directory)
+ENCODE_CONFIG_FILE = "temp/encode_config.json"
+ENCODE_SCRIPT_LOG = "temp/run_encode.log"
+
 # Terminal colors
 RESET = "\033[0m"
 BOLD = "\033[1m"
@@ -38,6 +84,11 @@ RED = "\033[38;5;196m"      # Error red
 CYAN = "\033[38;5;87m"      # Info cyan
 PURPLE = "\033[38;5;141m"   # Process purple
 
+# Combined styles used for headings
+BOLD_BLUE = BOLD + BLUE
+BOLD_GREEN = BOLD + GREEN
+BOLD_CYAN = BOLD + CYAN
+
 # Background colors
 BG_BLUE = "\033[48;5;24m"   # Blue background
 BG_DARK = "\033[48;5;235m"  # Dark background
@@ -63,43 +114,183 @@ DEFAULT_SETTINGS = {
     "smart_sorting": True
 }
 
-# File detection patterns
-IMAGE_EXTENSIONS = ['.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp']
-AUDIO_EXTENSIONS = ['.mp3', '.wav', '.m4a', '.aac', '.flac', '.ogg', '.opus']
-VIDEO_EXTENSIONS = ['.mp4', '.mov', '.avi', '.mkv', '.webm']
+# File detection patterns (lowercase tuples, so str.endswith can take them whole)
+IMAGE_EXTENSIONS = ('.jpg', '.jpeg', '.png', '.gif', '.bmp', '.tiff', '.webp')
+AUDIO_EXTENSIONS = ('.mp3', '.wav', '.m4a', '.aac', '.flac', '.ogg', '.opus')
+VIDEO_EXTENSIONS = ('.mp4', '.mov', '.avi', '.mkv', '.webm')
 
-# Common patterns in filenames
-DATE_PATTERNS = [
-    r'(\d{4}[-_]\d{2}[-_]\d{2})',  # YYYY-MM-DD or YYYY_MM_DD
-    r'(\d{2}[-_]\d{2}[-_]\d{4})',  # DD-MM-YYYY or DD_MM_YYYY
-    r'(\d{8})'  # YYYYMMDD
-]
+# Common patterns in filenames (compiled once at import)
+DATE_PATTERNS = (
+    re.compile(r'(\d{4}[-_]\d{2}[-_]\d{2})'),  # YYYY-MM-DD or YYYY_MM_DD
+    re.compile(r'(\d{2}[-_]\d{2}[-_]\d{4})'),  # DD-MM-YYYY or DD_MM_YYYY
+    re.compile(r'(\d{8})')  # YYYYMMDD
+)
 
 # Sequence pattern (e.g., img001.jpg, photo-2.jpg)
-SEQUENCE_PATTERNS = [
-    r'.*?(\d+).*?\.',  # Any digits before the extension
-]
+SEQUENCE_PATTERNS = (
+    re.compile(r'.*?(\d+).*?\.'),  # Any digits before the extension
+)
+
+# Date and sequence patterns fused into one regex for a single match() per
+# filename: every alternative is an anchored lookahead search for one pattern,
+# tried in list order, so the first DATE_PATTERNS groups hold what the first
+# matching date pattern would find and the rest do the same for sequences
+FILENAME_PATTERN = re.compile(
+    '(?:' + '|'.join(f'(?=.*?{p.pattern})' for p in DATE_PATTERNS) + ')?'
+    '(?:' + '|'.join(f'(?=.*?{p.pattern})' for p in SEQUENCE_PATTERNS) + ')?',
+    re.DOTALL
+)
+DATE_GROUP_COUNT = len(DATE_PATTERNS)
+
+# Separators that end a filename's leading prefix (e.g. "trip" in trip_beach.jpg)
+PREFIX_SEPARATOR = re.compile(r'[-_\s]')
+
+# Characters replaced with "_" when a group name becomes a directory name
+UNSAFE_DIR_CHARS = re.compile(r'[^\w\-]')
+
+# Units used by format_bytes, one per power of 1024
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
+# Hardware encoders and acceleration methods looked for in FFmpeg's probe output
+HW_ENCODERS = ("h264_videotoolbox", "h264_nvenc", "h264_qsv", "h264_vaapi")
+HW_ENCODER_PATTERN = re.compile(r'\b(' + '|'.join(HW_ENCODERS) + r')\b')
+HWACCEL_PATTERN = re.compile(r'\b(videotoolbox|cuda|qsv|vaapi)\b')
+FFMPEG_VERSION_PATTERN = re.compile(r'ffmpeg version (\S+)')
+
+# Pre-built rules wide enough for most terminals; rule_line() slices them
+_RULE_LINES = {"─": "─" * 240, "-": "-" * 240}
+
+# Home the cursor, clear the screen and drop the scrollback, as modern `clear` does
+CLEAR_SCREEN = "\033[H\033[2J\033[3J"
+
+# hw_info flags that mean at least one hardware encoding path is usable
+HW_ACCEL_FLAGS = ("has_videotoolbox", "has_nvenc", "has_intel_qsv", "has_vaapi")
+
+# Encoding-time multipliers relative to 1080p at the medium preset on a mid-range CPU
+_RES_TIME_FACTORS = {"3840x2160": 4.0, "1920x1080": 1.0, "1280x720": 0.5}
+_QUALITY_TIME_FACTORS = {"veryslow": 4.0, "slow": 2.0, "medium": 1.0, "fast": 0.5}
+_HW_ACCEL_TIME_FACTORS = {True: 0.25, False: 1.0}
+_CPU_TIME_FACTORS = {"apple": 0.5, "many_cores": 0.7, "other": 1.0}
+
+# Combined multiplier for every (resolution, quality, hw accel, cpu class) case
+TIME_FACTORS = {
+    (res, quality, hw_accel, cpu_class): res_factor * quality_factor * hw_factor * cpu_factor
+    for res, res_factor in _RES_TIME_FACTORS.items()
+    for quality, quality_factor in _QUALITY_TIME_FACTORS.items()
+    for hw_accel, hw_factor in _HW_ACCEL_TIME_FACTORS.items()
+    for cpu_class, cpu_factor in _CPU_TIME_FACTORS.items()
+}
 
-def print_styled(style, text):
-    """Print styled text with fallback for terminals without color support"""
-    if USE_COLORS:
-        print(f"{style}{text}{RESET}")
+# Terminal width cache, only trusted once watch_terminal_size() has installed
+# the SIGWINCH handler that invalidates it
+_TERM_WIDTH = None
+_TRACK_TERM_WIDTH = False
+
+# Cached output of the FFmpeg capability probes (filled in by probe_ffmpeg)
+_FFMPEG_CAPS = None
+
+# Audio durations already probed, keyed by (path, mtime_ns, size) so an edited
+# file is probed again
+_AUDIO_DURATIONS = {}
+
+def _invalidate_terminal_width(signum, frame):
+    """SIGWINCH handler: drop the cached width so the next query re-reads it"""
+    global _TERM_WIDTH
+    _TERM_WIDTH = None
+
+def watch_terminal_size():
+    """Start caching the terminal width, refreshed whenever the window is resized"""
+    global _TRACK_TERM_WIDTH
+    # Windows has no resize signal, so the width is queried on every call there
+    if hasattr(signal, "SIGWINCH"):
+        signal.signal(signal.SIGWINCH, _invalidate_terminal_width)
+        _TRACK_TERM_WIDTH = True
+
+def terminal_width():
+    """Get the terminal width in columns"""
+    global _TERM_WIDTH
+    if not _TRACK_TERM_WIDTH:
+        return shutil.get_terminal_size().columns
+    if _TERM_WIDTH is None:
+        _TERM_WIDTH = shutil.get_terminal_size().columns
+    return _TERM_WIDTH
+
+@lru_cache(maxsize=None)
+def _enable_vt_mode():
+    """Make sure the console understands ANSI escapes; True when it does
+    
+    Always true outside Windows. On Windows the console's virtual terminal
+    processing mode is switched on once and the result is cached.
+    """
+    if os.name != 'nt':
+        return True
+    try:
+        import ctypes
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.GetStdHandle(-11)  # STD_OUTPUT_HANDLE
+        mode = ctypes.c_uint32()
+        if not kernel32.GetConsoleMode(handle, ctypes.byref(mode)):
+            return False
+        # ENABLE_VIRTUAL_TERMINAL_PROCESSING
+        return bool(kernel32.SetConsoleMode(handle, mode.value | 0x0004))
+    except (ImportError, AttributeError, OSError):
+        return False
+
+def clear_screen():
+    """Clear the terminal and its scrollback without spawning a shell"""
+    if _enable_vt_mode():
+        sys.stdout.write(CLEAR_SCREEN)
+        sys.stdout.flush()
     else:
-        print(text)
+        os.system('cls')
+
+def _print_styled_color(style, text):
+    """Print text wrapped in the given ANSI style"""
+    sys.stdout.write(f"{style}{text}{RESET}\n")
+
+def _print_styled_plain(style, text):
+    """Print text without styling, for terminals without color support"""
+    sys.stdout.write(f"{text}\n")
+
+# Print styled text; rebound to the plain variant by main() when colors are off
+print_styled = _print_styled_color
+
+# Template for question prompts; main() swaps in the unstyled one when colors are off
+PROMPT_FORMAT = f"{CYAN}{{}}{RESET}"
+
+def rule_line(char, width):
+    """Return a horizontal rule `width` characters wide, sliced from a pre-built line when possible"""
+    line = _RULE_LINES.get(char)
+    if line is None or not 0 <= width <= len(line):
+        return char * width
+    return line[:width]
+
+@lru_cache(maxsize=8)
+def box_chrome(menu_width, unicode):
+    """Build the (top, bottom, side, divider) border strings of a status box
+    
+    They only depend on the width and character set, so each variant is built once.
+    """
+    if unicode:
+        bar = "─" * (menu_width - 2)
+        return (f"{LIGHT_GRAY}┌{bar}┐{RESET}", f"{LIGHT_GRAY}└{bar}┘{RESET}",
+                f"{LIGHT_GRAY}│{RESET}", f"{LIGHT_GRAY}├{bar}┤{RESET}")
+    rule = f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
+    return rule, rule, f"{LIGHT_GRAY}|{RESET}", rule
 
 def draw_divider():
     """Draw a horizontal divider line"""
-    width = shutil.get_terminal_size().columns
+    width = terminal_width()
     char = "─" if USE_UNICODE else "-"
     
     if USE_COLORS:
-        print(f"{GRAY}{char * width}{RESET}")
+        print(f"{GRAY}{rule_line(char, width)}{RESET}")
     else:
-        print(char * width)
+        print(rule_line(char, width))
 
 def center_text(text, style=BLUE):
     """Center text in the terminal"""
-    width = shutil.get_terminal_size().columns
+    width = terminal_width()
     padding = (width - len(text)) // 2
     
     if USE_COLORS:
@@ -117,35 +308,31 @@ def show_logo():
 
 def show_banner():
     """Display the application banner with modern clean aesthetics"""
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
     
     # Get terminal width
-    width = shutil.get_terminal_size().columns
+    width = terminal_width()
     
     # Create styled header bar
     if USE_COLORS:
         print(f"{BG_BLUE}{' ' * width}{RESET}")
     
     # Display clean, modern logo
-    width = shutil.get_terminal_size().columns
-    title = f"{BLUE}{BOLD}SlideSonic{RESET}"
-    padding = (width - len(title.replace(BLUE, "").replace(BOLD, "").replace(RESET, ""))) // 2
-    print(f"{' ' * padding}{title}")
+    padding = (width - len(BANNER_TITLE)) // 2
+    print(f"{' ' * padding}{BLUE}{BOLD}{BANNER_TITLE}{RESET}")
     
     # Add subtitle with elegant typography
     if USE_COLORS:
-        padding = (width - 32) // 2  # "Create stunning slideshow videos" is 32 chars
-        print(f"{' ' * padding}{BOLD}{CYAN}Create stunning slideshow videos{RESET}")
+        padding = (width - len(BANNER_SUBTITLE)) // 2
+        print(f"{' ' * padding}{BOLD}{CYAN}{BANNER_SUBTITLE}{RESET}")
         
         # Add version and branding
-        version_text = f"Version {VERSION} | Chamath Thiwanka (CHX)"
-        version_padding = (width - len(version_text)) // 2
-        print(f"{' ' * version_padding}{GRAY}{version_text}{RESET}")
+        version_padding = (width - len(BANNER_CREDIT)) // 2
+        print(f"{' ' * version_padding}{GRAY}{BANNER_CREDIT}{RESET}")
         
         # Add github link
-        github_text = f"https://github.com/chama-x/SlideSonic-2025"
-        github_padding = (width - len(github_text)) // 2
-        print(f"{' ' * github_padding}{LIGHT_GRAY}{github_text}{RESET}")
+        github_padding = (width - len(GITHUB_URL)) // 2
+        print(f"{' ' * github_padding}{LIGHT_GRAY}{GITHUB_URL}{RESET}")
         
         # Add elegant separator
         if USE_UNICODE:
@@ -153,73 +340,115 @@ def show_banner():
             separator = separator.center(width)
             print(f"{GRAY}{separator}{RESET}")
         else:
-            print(f"{GRAY}{'-' * width}{RESET}")
+            print(f"{GRAY}{rule_line('-', width)}{RESET}")
     else:
-        center_text("Create stunning slideshow videos")
-        center_text(f"Version {VERSION} | Chamath Thiwanka (CHX)")
-        center_text("https://github.com/chama-x/SlideSonic-2025")
-        print("-" * width)
+        center_text(BANNER_SUBTITLE)
+        center_text(BANNER_CREDIT)
+        center_text(GITHUB_URL)
+        print(rule_line("-", width))
     
     print()
 
 def ask_question(prompt, default=None, options=None, password=False):
     """Ask a question and get user input with optional validation"""
+    # The prompt and valid answers don't change between retries, so build them once
+    if default is not None:
+        prompt_text = PROMPT_FORMAT.format(f"{prompt} [{default}]: ")
+    else:
+        prompt_text = PROMPT_FORMAT.format(f"{prompt}: ")
+    
+    valid_answers = frozenset(options) if options else None
+    
     while True:
-        if default is not None:
-            prompt_text = f"{prompt} [{default}]: "
-        else:
-            prompt_text = f"{prompt}: "
-        
-        if USE_COLORS:
-            sys.stdout.write(f"{CYAN}{prompt_text}{RESET}")
-        else:
-            sys.stdout.write(prompt_text)
-        
+        sys.stdout.write(prompt_text)
         sys.stdout.flush()
         
-        if password:
-            import getpass
-            answer = getpass.getpass("")
-        else:
-            answer = input()
+        answer = getpass.getpass("") if password else input()
         
         if not answer and default is not None:
             return default
         
-        if options and answer not in options:
+        if valid_answers and answer not in valid_answers:
             print_styled(YELLOW, f"Please choose from: {', '.join(options)}")
             continue
         
         if answer:
             return answer
 
-def show_spinner(message, seconds=1):
-    """Show a spinner animation with a message"""
-    if not USE_ANIMATIONS:
-        print_styled(GRAY, f"{message}...")
-        time.sleep(seconds)
-        return
+def wait_for_key(prompt):
+    """Show a prompt and return after a single keypress
     
-    frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"] if USE_UNICODE else ["-", "\\", "|", "/"]
-    end_time = time.time() + seconds
+    Falls back to input() when stdin is not a terminal (piped or scripted runs).
+    """
+    sys.stdout.write(prompt)
+    sys.stdout.flush()
     
-    try:
-        # Hide cursor
-        print("\033[?25l", end="", flush=True)
+    if sys.stdin.isatty():
+        if HAVE_MSVCRT:
+            msvcrt.getch()
+            sys.stdout.write("\n")
+            return
+        if HAVE_TERMIOS:
+            fd = sys.stdin.fileno()
+            old_attrs = termios.tcgetattr(fd)
+            try:
+                # cbreak rather than raw mode, so Ctrl+C still interrupts
+                tty.setcbreak(fd)
+                os.read(fd, 1)
+            finally:
+                # TCSAFLUSH also drops the rest of multi-byte keys such as arrows
+                termios.tcsetattr(fd, termios.TCSAFLUSH, old_attrs)
+            sys.stdout.write("\n")
+            return
+    
+    input()
+
+class Spinner:
+    """Show a spinner animation with a message while the wrapped block runs
+    
+    Usage: with Spinner("Scanning media files"): do_work()
+    """
+    
+    def __init__(self, message):
+        self.message = message
+        self._stop = threading.Event()
+        self._thread = None
+    
+    def __enter__(self):
+        if not USE_ANIMATIONS:
+            print_styled(GRAY, f"{self.message}...")
+            return self
         
-        i = 0
-        while time.time() < end_time:
-            sys.stdout.write(f"\r{GRAY}{frames[i]} {message}...{RESET}")
-            sys.stdout.flush()
-            time.sleep(0.1)
-            i = (i + 1) % len(frames)
+        self._thread = threading.Thread(target=self._spin, daemon=True)
+        self._thread.start()
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback):
+        if self._thread is None:
+            return False
+        
+        self._stop.set()
+        self._thread.join()
         
-        # Clear the line
-        sys.stdout.write("\r" + " " * (len(message) + 15) + "\r")
+        # Clear the line and show cursor in one write
+        sys.stdout.write("\r" + " " * (len(self.message) + 15) + "\r\033[?25h")
         sys.stdout.flush()
-    finally:
-        # Show cursor
-        print("\033[?25h", end="", flush=True)
+        return False
+    
+    def _spin(self):
+        frames = ["⠋", "⠙", "⠹", "⠸", "⠼", "⠴", "⠦", "⠧", "⠇", "⠏"] if USE_UNICODE else ["-", "\\", "|", "/"]
+        
+        # Pre-render every frame so the loop only writes; the cursor is hidden
+        # by the first frame's write rather than a separate one
+        lines = [f"\r{GRAY}{frame} {self.message}...{RESET}" for frame in frames]
+        first = f"\033[?25l{lines[0]}"
+        
+        for line in itertools.chain([first], itertools.islice(itertools.cycle(lines), 1, None)):
+            sys.stdout.write(line)
+            sys.stdout.flush()
+            # Wakes early as soon as the work finishes
+            if self._stop.wait(0.1):
+                break
 
 def parse_args():
     """Parse command line arguments"""
@@ -233,36 +462,109 @@ def parse_args():
     parser.add_argument('--batch', action='store_true', help='Run batch processing on subdirectories')
     return parser.parse_args()
 
-def get_hardware_info():
-    """Get basic hardware information"""
-    result = {
-        "os": platform.system(),
-        "os_version": platform.version(),
-        "architecture": platform.machine(),
-        "python_version": platform.python_version(),
-        "cpu_cores": os.cpu_count(),
-        "memory_total": None,
-        "ffmpeg_version": None,
-        "apple_silicon": platform.machine() == "arm64" and platform.system() == "Darwin"
-    }
-    
-    # Get memory info
-    if HAVE_PSUTIL:
+def _read_hw_encoders(process):
+    """Stream `ffmpeg -encoders` output and return the hardware encoders it lists"""
+    found = set()
+    listing = False
+    with process:
+        for line in process.stdout:
+            if not listing:
+                listing = line.startswith(" ------")
+            elif line[1:2] in ("A", "S"):
+                # Video encoders are listed first, so past them nothing further can match
+                process.kill()
+                return found
+            found.update(HW_ENCODER_PATTERN.findall(line))
+            if len(found) == len(HW_ENCODERS):
+                # Every encoder of interest is listed, so skip the rest of the output
+                process.kill()
+                return found
+    return found if process.returncode == 0 else None
+
+@lru_cache(maxsize=None)
+def find_tool(name):
+    """Resolve an FFmpeg tool on PATH once; None when it is not installed"""
+    return shutil.which(name)
+
+def probe_ffmpeg():
+    """Run the FFmpeg version, encoder and hwaccel probes concurrently and cache the results
+    
+    Returns the version text plus the sets of hardware encoders and hwaccels found.
+    """
+    global _FFMPEG_CAPS
+    if _FFMPEG_CAPS is not None:
+        return _FFMPEG_CAPS
+    
+    # Without FFmpeg every probe would fail, so don't spawn any
+    ffmpeg = find_tool("ffmpeg")
+    if ffmpeg is None:
+        _FFMPEG_CAPS = {"version": None, "encoders": None, "hwaccels": None}
+        return _FFMPEG_CAPS
+    
+    # Launch every probe before waiting on any, so the process startups overlap
+    processes = {}
+    for key in ("version", "encoders", "hwaccels"):
         try:
-            mem = psutil.virtual_memory()
-            result["memory_total"] = mem.total
-            result["memory_available"] = mem.available
-        except Exception:
-            pass
+            processes[key] = subprocess.Popen([ffmpeg, '-hide_banner', f'-{key}'], stdout=subprocess.PIPE,
+                                              stderr=subprocess.DEVNULL, text=True)
+        except OSError:
+            processes[key] = None
+    
+    # A probe that failed to start or exited non-zero is recorded as None
+    caps = {}
+    for key, process in processes.items():
+        if process is None:
+            caps[key] = None
+        elif key == "encoders":
+            caps[key] = _read_hw_encoders(process)
+        else:
+            stdout, _ = process.communicate()
+            if process.returncode != 0:
+                caps[key] = None
+            elif key == "hwaccels":
+                caps[key] = set(HWACCEL_PATTERN.findall(stdout))
+            else:
+                caps[key] = stdout
     
-    # Get FFmpeg version
-    try:
-        process = subprocess.run(['ffmpeg', '-version'], capture_output=True, text=True, check=True)
-        version_match = re.search(r'ffmpeg version (\S+)', process.stdout)
+    _FFMPEG_CAPS = caps
+    return caps
+
+@lru_cache(maxsize=1)
+def get_hardware_info():
+    """Get basic hardware information (static for the process, so computed once)"""
+    # Start the FFmpeg probes first so they run while the local queries are made
+    with ThreadPoolExecutor(max_workers=1) as executor:
+        ffmpeg_caps = executor.submit(probe_ffmpeg)
+        
+        result = {
+            "os": platform.system(),
+            "os_version": platform.version(),
+            "architecture": platform.machine(),
+            "python_version": platform.python_version(),
+            "cpu_cores": os.cpu_count(),
+            "physical_cores": None,
+            "memory_total": None,
+            "ffmpeg_version": None,
+            "apple_silicon": platform.machine() == "arm64" and platform.system() == "Darwin"
+        }
+        
+        # Get physical core count and memory info
+        if HAVE_PSUTIL:
+            import psutil
+            try:
+                result["physical_cores"] = psutil.cpu_count(logical=False)
+                mem = psutil.virtual_memory()
+                result["memory_total"] = mem.total
+            except Exception:
+                pass
+        
+        # Get FFmpeg version
+        version_output = ffmpeg_caps.result()["version"]
+    
+    if version_output:
+        version_match = FFMPEG_VERSION_PATTERN.search(version_output)
         if version_match:
             result["ffmpeg_version"] = version_match.group(1)
-    except (subprocess.SubprocessError, FileNotFoundError):
-        pass
     
     return result
 
@@ -271,17 +573,16 @@ def format_bytes(bytes_value):
     if bytes_value is None:
         return "Unknown"
     
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024 or unit == 'TB':
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    index = min((max(int(bytes_value), 1).bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (index * 10)):.2f} {BYTE_UNITS[index]}"
 
 def run_hardware_analysis():
     """Analyze hardware capabilities with Apple-inspired design aesthetics"""
     show_banner()
     
     # Get terminal width for centered content
-    width = shutil.get_terminal_size().columns
+    width = terminal_width()
     menu_width = min(80, width - 10)
     
     # Display section header
@@ -290,13 +591,13 @@ def run_hardware_analysis():
         padding = (menu_width - len(section_title)) // 2
         if USE_UNICODE:
             print(f"{' ' * padding}{BOLD}{BLUE}•{section_title}•{RESET}")
-            print(f"{GRAY}{'─' * menu_width}{RESET}")
+            print(f"{GRAY}{rule_line('─', menu_width)}{RESET}")
         else:
             print(f"{' ' * padding}{BOLD}{BLUE}{section_title}{RESET}")
-            print(f"{GRAY}{'-' * menu_width}{RESET}")
+            print(f"{GRAY}{rule_line('-', menu_width)}{RESET}")
     else:
         print("Hardware Analysis")
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
     
     print()
     
@@ -306,18 +607,92 @@ def run_hardware_analysis():
     else:
         print("Analyzing system capabilities...")
     
-    show_spinner("Gathering system information", 2)
-    
     # Get hardware info
-    hw_info = get_hardware_info()
+    with Spinner("Gathering system information"):
+        hw_info = get_hardware_info()
+    
+    # Build the report in memory and write it to the terminal in one go
+    report = io.StringIO()
+    with contextlib.redirect_stdout(report):
+        print_hardware_report(hw_info, menu_width)
+    sys.stdout.write(report.getvalue())
+    sys.stdout.flush()
+    
+    wait_for_key("\nPress Enter to return to the main menu...")
+
+def _performance_profile(hw_info, has_hw_accel):
+    """Score the machine and derive the recommended settings and encoding speed
+    
+    Returns a dict with the score, the tier name, description and color, the
+    recommended resolution and quality, and the estimated seconds of encoding
+    per minute of video.
+    """
+    apple_silicon = hw_info.get("apple_silicon")
+    cpu_cores = hw_info.get("cpu_cores", 0)
+    memory_gb = hw_info.get("memory_gb", 0)
+    
+    # Performance rating
+    perf_score = 0
+    if apple_silicon:
+        perf_score += 4
+    elif cpu_cores >= 8:
+        perf_score += 3
+    elif cpu_cores >= 4:
+        perf_score += 2
+    else:
+        perf_score += 1
+        
+    if has_hw_accel:
+        perf_score += 2
+        
+    if memory_gb >= 16:
+        perf_score += 2
+    elif memory_gb >= 8:
+        perf_score += 1
+    
+    # Performance tier
+    if perf_score >= 7:
+        tier, tier_detail, tier_color = "Excellent", "Can handle 4K with high quality", GREEN
+    elif perf_score >= 5:
+        tier, tier_detail, tier_color = "Good", "Suitable for 1080p high quality", CYAN
+    elif perf_score >= 3:
+        tier, tier_detail, tier_color = "Moderate", "Best for 1080p standard quality", YELLOW
+    else:
+        tier, tier_detail, tier_color = "Basic", "Recommended 720p, standard quality", RED
+    
+    # Best settings recommendation
+    recommended_res = "3840x2160" if perf_score >= 7 else "1920x1080" if perf_score >= 3 else "1280x720"
+    recommended_quality = "veryslow" if perf_score >= 7 else "slow" if perf_score >= 5 else "medium" if perf_score >= 3 else "fast"
+    
+    # Calculate expected encoding time per minute of video
+    base_time = 60  # seconds per minute of video at 1080p medium preset
+    cpu_class = "apple" if apple_silicon else "many_cores" if cpu_cores >= 8 else "other"
+    time_factor = TIME_FACTORS[recommended_res, recommended_quality, bool(has_hw_accel), cpu_class]
+    
+    return {
+        "score": perf_score,
+        "tier": tier,
+        "tier_detail": tier_detail,
+        "tier_color": tier_color,
+        "recommended_res": recommended_res,
+        "recommended_quality": recommended_quality,
+        "seconds_per_minute": base_time * time_factor,
+    }
+
+def format_estimate(seconds):
+    """Format an estimated duration as m:ss, or as whole seconds under a minute"""
+    if seconds >= 60:
+        return f"{int(seconds // 60)}:{int(seconds % 60):02d}"
+    return f"{int(seconds)} seconds"
+
+def print_hardware_report(hw_info, menu_width):
+    """Print the hardware, performance and encoder sections of the hardware analysis"""
+    has_hw_accel = any(hw_info.get(flag) for flag in HW_ACCEL_FLAGS)
     
     # Output in a nice box
     if USE_COLORS:
         # Box style
-        status_box_top = f"{LIGHT_GRAY}┌{'─' * (menu_width - 2)}┐{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
-        status_box_bottom = f"{LIGHT_GRAY}└{'─' * (menu_width - 2)}┘{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
-        status_side = f"{LIGHT_GRAY}│{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}|{RESET}"
-        divider = f"{LIGHT_GRAY}├{'─' * (menu_width - 2)}┤{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
+        status_box_top, status_box_bottom, status_side, divider = box_chrome(menu_width, USE_UNICODE)
         
         print("\n" + status_box_top)
         print(f"{status_side} {BOLD}System Information{RESET}{' ' * (menu_width - 20)}{status_side}")
@@ -378,79 +753,21 @@ def run_hardware_analysis():
         print(divider)
         print(f"{status_side} {BOLD}Performance Estimate{RESET}{' ' * (menu_width - 22)}{status_side}")
         
-        # Performance rating
-        perf_score = 0
-        if hw_info.get("apple_silicon"):
-            perf_score += 4
-        elif hw_info.get("cpu_cores", 0) >= 8:
-            perf_score += 3
-        elif hw_info.get("cpu_cores", 0) >= 4:
-            perf_score += 2
-        else:
-            perf_score += 1
-            
-        if hw_info.get("has_videotoolbox") or hw_info.get("has_nvenc") or hw_info.get("has_intel_qsv") or hw_info.get("has_vaapi"):
-            perf_score += 2
-            
-        if hw_info.get("memory_gb", 0) >= 16:
-            perf_score += 2
-        elif hw_info.get("memory_gb", 0) >= 8:
-            perf_score += 1
-        
-        # Performance tier
-        performance_tier = ""
-        if perf_score >= 7:
-            performance_tier = f"{GREEN}Excellent{RESET} - Can handle 4K with high quality"
-        elif perf_score >= 5:
-            performance_tier = f"{CYAN}Good{RESET} - Suitable for 1080p high quality"
-        elif perf_score >= 3:
-            performance_tier = f"{YELLOW}Moderate{RESET} - Best for 1080p standard quality"
-        else:
-            performance_tier = f"{RED}Basic{RESET} - Recommended 720p, standard quality"
-        
-        print(info_row("Performance", performance_tier, ""))
+        profile = _performance_profile(hw_info, has_hw_accel)
+        print(info_row("Performance", f"{profile['tier_color']}{profile['tier']}{RESET} - {profile['tier_detail']}", ""))
         
         # Best settings recommendation
-        recommended_res = "3840x2160" if perf_score >= 7 else "1920x1080" if perf_score >= 3 else "1280x720"
-        recommended_quality = "veryslow" if perf_score >= 7 else "slow" if perf_score >= 5 else "medium" if perf_score >= 3 else "fast"
-        
-        print(info_row("Recommended Resolution", recommended_res))
-        print(info_row("Recommended Quality", recommended_quality))
-        
-        # Calculate expected encoding time per minute of video
-        base_time = 60  # seconds per minute of video at 1080p medium preset
-        time_factor = 1.0
-        
-        if "3840x2160" in recommended_res:
-            time_factor *= 4.0
-        elif "1280x720" in recommended_res:
-            time_factor *= 0.5
-            
-        if "veryslow" in recommended_quality:
-            time_factor *= 4.0
-        elif "slow" in recommended_quality:
-            time_factor *= 2.0
-        elif "fast" in recommended_quality:
-            time_factor *= 0.5
-            
-        if hw_info.get("has_videotoolbox") or hw_info.get("has_nvenc") or hw_info.get("has_intel_qsv") or hw_info.get("has_vaapi"):
-            time_factor *= 0.25
-            
-        if hw_info.get("apple_silicon"):
-            time_factor *= 0.5
-        elif hw_info.get("cpu_cores", 0) >= 8:
-            time_factor *= 0.7
-            
-        estimated_time = base_time * time_factor
-        estimated_str = f"{int(estimated_time // 60)}:{int(estimated_time % 60):02d}" if estimated_time >= 60 else f"{int(estimated_time)} seconds"
+        print(info_row("Recommended Resolution", profile["recommended_res"]))
+        print(info_row("Recommended Quality", profile["recommended_quality"]))
         
+        estimated_str = format_estimate(profile["seconds_per_minute"])
         print(info_row("Est. Processing Time", f"{estimated_str} per minute of video"))
         
         print(status_box_bottom)
     else:
         # Non-colored version
         print("\nSystem Information:")
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
         print(f"Operating System: {hw_info.get('os_name', 'Unknown')} {hw_info.get('os_version', '')}")
         print(f"Processor: {hw_info.get('cpu_model', 'Unknown')}")
         print(f"CPU Cores: {hw_info.get('cpu_cores', 'Unknown')} cores, {hw_info.get('cpu_threads', 'Unknown')} threads")
@@ -459,7 +776,7 @@ def run_hardware_analysis():
             print(f"Memory: {hw_info['memory_gb']:.1f} GB")
         
         print("\nEncoding Capabilities:")
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
         
         if hw_info.get("has_videotoolbox"):
             print(f"Apple VideoToolbox: Available (Hardware Acceleration)")
@@ -485,73 +802,16 @@ def run_hardware_analysis():
             print(f"FFmpeg: {hw_info.get('ffmpeg_version', 'Unknown')}")
         
         print("\nPerformance Estimate:")
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
         
-        # Performance rating
-        perf_score = 0
-        if hw_info.get("apple_silicon"):
-            perf_score += 4
-        elif hw_info.get("cpu_cores", 0) >= 8:
-            perf_score += 3
-        elif hw_info.get("cpu_cores", 0) >= 4:
-            perf_score += 2
-        else:
-            perf_score += 1
-            
-        if hw_info.get("has_videotoolbox") or hw_info.get("has_nvenc") or hw_info.get("has_intel_qsv") or hw_info.get("has_vaapi"):
-            perf_score += 2
-            
-        if hw_info.get("memory_gb", 0) >= 16:
-            perf_score += 2
-        elif hw_info.get("memory_gb", 0) >= 8:
-            perf_score += 1
-        
-        # Performance tier
-        if perf_score >= 7:
-            performance_tier = "Excellent - Can handle 4K with high quality"
-        elif perf_score >= 5:
-            performance_tier = "Good - Suitable for 1080p high quality"
-        elif perf_score >= 3:
-            performance_tier = "Moderate - Best for 1080p standard quality"
-        else:
-            performance_tier = "Basic - Recommended 720p, standard quality"
-        
-        print(f"Performance: {performance_tier}")
+        profile = _performance_profile(hw_info, has_hw_accel)
+        print(f"Performance: {profile['tier']} - {profile['tier_detail']}")
         
         # Best settings recommendation
-        recommended_res = "3840x2160" if perf_score >= 7 else "1920x1080" if perf_score >= 3 else "1280x720"
-        recommended_quality = "veryslow" if perf_score >= 7 else "slow" if perf_score >= 5 else "medium" if perf_score >= 3 else "fast"
-        
-        print(f"Recommended Resolution: {recommended_res}")
-        print(f"Recommended Quality: {recommended_quality}")
-        
-        # Calculate expected encoding time per minute of video
-        base_time = 60  # seconds per minute of video at 1080p medium preset
-        time_factor = 1.0
-        
-        if "3840x2160" in recommended_res:
-            time_factor *= 4.0
-        elif "1280x720" in recommended_res:
-            time_factor *= 0.5
-            
-        if "veryslow" in recommended_quality:
-            time_factor *= 4.0
-        elif "slow" in recommended_quality:
-            time_factor *= 2.0
-        elif "fast" in recommended_quality:
-            time_factor *= 0.5
-            
-        if hw_info.get("has_videotoolbox") or hw_info.get("has_nvenc") or hw_info.get("has_intel_qsv") or hw_info.get("has_vaapi"):
-            time_factor *= 0.25
-            
-        if hw_info.get("apple_silicon"):
-            time_factor *= 0.5
-        elif hw_info.get("cpu_cores", 0) >= 8:
-            time_factor *= 0.7
-            
-        estimated_time = base_time * time_factor
-        estimated_str = f"{int(estimated_time // 60)}:{int(estimated_time % 60):02d}" if estimated_time >= 60 else f"{int(estimated_time)} seconds"
+        print(f"Recommended Resolution: {profile['recommended_res']}")
+        print(f"Recommended Quality: {profile['recommended_quality']}")
         
+        estimated_str = format_estimate(profile["seconds_per_minute"])
         print(f"Est. Processing Time: {estimated_str} per minute of video")
     
     # Best encoders selection
@@ -561,13 +821,13 @@ def run_hardware_analysis():
         padding = (menu_width - len(encoder_title)) // 2
         if USE_UNICODE:
             print(f"{' ' * padding}{BOLD}{GREEN}•{encoder_title}•{RESET}")
-            print(f"{GRAY}{'─' * menu_width}{RESET}")
+            print(f"{GRAY}{rule_line('─', menu_width)}{RESET}")
         else:
             print(f"{' ' * padding}{BOLD}{GREEN}{encoder_title}{RESET}")
-            print(f"{GRAY}{'-' * menu_width}{RESET}")
+            print(f"{GRAY}{rule_line('-', menu_width)}{RESET}")
     else:
         print("Optimal Encoder Selection:")
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
     
     # Detect best encoder and explain why
     encoder = detect_best_encoder()
@@ -596,8 +856,6 @@ def run_hardware_analysis():
     print()
     
     # Add a section for hardware acceleration status
-    has_hw_accel = hw_info.get("has_videotoolbox") or hw_info.get("has_nvenc") or hw_info.get("has_intel_qsv") or hw_info.get("has_vaapi")
-    
     if USE_COLORS:
         if has_hw_accel:
             hw_icon = f"{GREEN}✓{RESET}" if USE_UNICODE else f"{GREEN}√{RESET}"
@@ -632,95 +890,166 @@ def run_hardware_analysis():
         else:
             print(f"Hardware acceleration: Not available")
             print(f"  Using software encoding only")
-    
-    input("\nPress Enter to return to the main menu...")
 
 def load_settings():
     """Load settings from file or use defaults"""
-    settings_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "settings.json")
+    settings_file = _SETTINGS_PATH
     
     if os.path.exists(settings_file):
         try:
-            with open(settings_file, 'r') as f:
-                settings = json.load(f)
-            
-            # Check for missing settings and add defaults
-            for key, value in DEFAULT_SETTINGS.items():
-                if key not in settings:
-                    settings[key] = value
+            with open(settings_file, 'rb') as f:
+                data = f.read()
+            loaded = orjson.loads(data) if HAVE_ORJSON else json.loads(data)
+            if not isinstance(loaded, dict):
+                raise ValueError("settings must be a JSON object")
             
-            return settings
-        except (json.JSONDecodeError, IOError):
+            # Fill in any missing settings from the defaults
+            return {**DEFAULT_SETTINGS, **loaded}
+        except (ValueError, IOError):
             print_styled(YELLOW, "Warning: Could not load settings, using defaults")
     
     return DEFAULT_SETTINGS.copy()
 
 def save_settings(settings):
     """Save settings to file"""
-    settings_file = os.path.join(os.path.dirname(os.path.realpath(__file__)), "settings.json")
+    settings_file = _SETTINGS_PATH
+    tmp_file = settings_file + ".tmp"
     
     try:
-        with open(settings_file, 'w') as f:
-            json.dump(settings, f, indent=4)
+        if HAVE_ORJSON:
+            data = orjson.dumps(settings, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(settings, indent=2).encode("utf-8")
+        
+        # Write beside the target and swap it in, so a crash never leaves a partial file
+        with open(tmp_file, 'wb') as f:
+            f.write(data)
+        os.replace(tmp_file, settings_file)
         return True
-    except IOError:
+    except (TypeError, IOError):
         print_styled(YELLOW, "Warning: Could not save settings")
         return False
 
+@lru_cache(maxsize=None)
+def suffix_variants(extensions):
+    """Build (common_spellings, lowercase) suffix tuples for case-insensitive matching
+    
+    Names ending in a lowercase, uppercase or capitalized extension (.jpg, .JPG,
+    .Jpg) match the first tuple directly; only other spellings need lowercasing.
+    Results are cached per extension tuple, so each set is built only once.
+    """
+    lowercase = tuple(ext.lower() for ext in extensions)
+    common = lowercase + tuple(ext.upper() for ext in lowercase) + tuple(ext[:2].upper() + ext[2:] for ext in lowercase)
+    return common, lowercase
+
+def has_suffix(name, variants):
+    """Check a filename against suffix_variants() without lowercasing common spellings"""
+    common, lowercase = variants
+    return name.endswith(common) or name.lower().endswith(lowercase)
+
+def fast_copy(source_path, target_path):
+    """Copy a file and its metadata, letting the kernel move the data"""
+    # copy_file_range is Linux-only; elsewhere copy2 is used
+    if hasattr(os, "copy_file_range"):
+        try:
+            with open(source_path, 'rb') as src, open(target_path, 'wb') as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+            shutil.copystat(source_path, target_path)
+            return
+        except OSError:
+            # e.g. cross-device on older kernels; copy2 rewrites the target
+            pass
+    shutil.copy2(source_path, target_path)
+
+def link_or_copy(source_path, target_path):
+    """Hardlink a file into place, copying only when a link isn't possible"""
+    # Copying a path onto itself would destroy it, so refuse like copy2 does
+    if os.path.abspath(source_path) == os.path.abspath(target_path):
+        raise shutil.SameFileError(f"{source_path!r} and {target_path!r} are the same file")
+    
+    try:
+        os.link(source_path, target_path)
+        return
+    except FileExistsError:
+        # Already a link to the source (an earlier import or organize run)
+        if os.path.samefile(source_path, target_path):
+            return
+    except OSError:
+        # Other filesystem or no hardlink support
+        fast_copy(source_path, target_path)
+        return
+    
+    # Re-importing replaces the existing file, as copy2 would. The new file is
+    # put beside it and swapped in, so the target is never missing on failure.
+    target_dir, target_name = os.path.split(target_path)
+    tmp_path = os.path.join(target_dir, f".{target_name}.{os.getpid()}.tmp")
+    try:
+        try:
+            os.link(source_path, tmp_path)
+        except OSError:
+            fast_copy(source_path, tmp_path)
+        os.replace(tmp_path, target_path)
+    except BaseException:
+        with contextlib.suppress(OSError):
+            os.unlink(tmp_path)
+        raise
+
 def count_files(directory, extensions):
     """Count files with specific extensions in a directory"""
     if not os.path.exists(directory):
         return 0
     
-    return len([f for f in os.listdir(directory) if os.path.isfile(os.path.join(directory, f)) and 
-                any(f.lower().endswith(ext) for ext in extensions)])
+    variants = suffix_variants(extensions)
+    with os.scandir(directory) as entries:
+        return sum(1 for entry in entries if entry.is_file() and has_suffix(entry.name, variants))
 
-def detect_best_encoder():
-    """Detect the best encoder based on the system capabilities, prioritizing speed over quality"""
-    hw_info = get_hardware_info()
+@lru_cache(maxsize=1)
+def select_best_encoder():
+    """Pick the fastest available encoder, returning (encoder, style, message)"""
+    # Check available encoders and hardware acceleration (shared with get_hardware_info)
+    caps = probe_ffmpeg()
+    encoders = caps["encoders"]
+    hwaccels = caps["hwaccels"]
     
-    print_styled(CYAN, "Detecting fastest available encoder...")
-    
-    # Check available encoders
-    try:
-        process = subprocess.run(['ffmpeg', '-encoders'], capture_output=True, text=True, check=True)
-        encoders_output = process.stdout
-        
-        # Check for hardware acceleration
-        process = subprocess.run(['ffmpeg', '-hwaccels'], capture_output=True, text=True, check=True)
-        hwaccels_output = process.stdout
-        
+    if encoders is not None and hwaccels is not None:
         # Hardware encoding is always faster, so prioritize any hardware encoder
         
         # Apple Silicon with VideoToolbox - fastest for Mac
-        if 'videotoolbox' in hwaccels_output:
-            if "h264_videotoolbox" in encoders_output:
-                print_styled(GREEN, "✓ Using Apple VideoToolbox hardware acceleration for maximum speed")
-                return "h264_videotoolbox"
+        if 'videotoolbox' in hwaccels:
+            if "h264_videotoolbox" in encoders:
+                return "h264_videotoolbox", GREEN, "✓ Using Apple VideoToolbox hardware acceleration for maximum speed"
             
         # NVIDIA GPU with NVENC - extremely fast
-        if 'cuda' in hwaccels_output and 'h264_nvenc' in encoders_output:
-            print_styled(GREEN, "✓ Using NVIDIA NVENC hardware acceleration for maximum speed")
-            return "h264_nvenc"
+        if 'cuda' in hwaccels and 'h264_nvenc' in encoders:
+            return "h264_nvenc", GREEN, "✓ Using NVIDIA NVENC hardware acceleration for maximum speed"
         
         # Intel QuickSync - good speed
-        if 'qsv' in hwaccels_output and 'h264_qsv' in encoders_output:
-            print_styled(GREEN, "✓ Using Intel QuickSync hardware acceleration for maximum speed")
-            return "h264_qsv"
+        if 'qsv' in hwaccels and 'h264_qsv' in encoders:
+            return "h264_qsv", GREEN, "✓ Using Intel QuickSync hardware acceleration for maximum speed"
         
         # VA-API - decent speed on Linux
-        if 'vaapi' in hwaccels_output and 'h264_vaapi' in encoders_output:
-            print_styled(GREEN, "✓ Using VA-API hardware acceleration for maximum speed")
-            return "h264_vaapi"
+        if 'vaapi' in hwaccels and 'h264_vaapi' in encoders:
+            return "h264_vaapi", GREEN, "✓ Using VA-API hardware acceleration for maximum speed"
         
         # No hardware acceleration available, use fastest software encoder
         # H.264 is much faster than H.265 for encoding
-        print_styled(YELLOW, "! No hardware acceleration detected. Using libx264 with ultrafast preset")
-        return "libx264"
+        return "libx264", YELLOW, "! No hardware acceleration detected. Using libx264 with ultrafast preset"
     
-    except subprocess.SubprocessError:
-        print_styled(RED, "✗ Error detecting encoders, falling back to libx264")
-        return "libx264"  # Default
+    return "libx264", RED, "✗ Error detecting encoders, falling back to libx264"  # Default
+
+def detect_best_encoder():
+    """Detect the best encoder based on the system capabilities, prioritizing speed over quality"""
+    print_styled(CYAN, "Detecting fastest available encoder...")
+    
+    # The choice is computed once per run; only the report is repeated
+    encoder, style, message = select_best_encoder()
+    print_styled(style, message)
+    return encoder
 
 def create_slideshow_interactive():
     """Create a slideshow with smart interactive settings and modern design aesthetics"""
@@ -729,11 +1058,8 @@ def create_slideshow_interactive():
     # Load settings
     settings = load_settings()
     
-    # Show a spinner while scanning
-    show_spinner("Scanning for media files", 1)
-    
     # Get terminal width for centered content
-    width = shutil.get_terminal_size().columns
+    width = terminal_width()
     menu_width = min(80, width - 10)
     
     # Auto-organize images and find matching audio
@@ -742,7 +1068,9 @@ def create_slideshow_interactive():
     else:
         print("\nAnalyzing files...")
     
-    media_data = auto_organize_images(recursive=settings.get("recursive_scan", False))
+    # Show a spinner while scanning
+    with Spinner("Scanning for media files"):
+        media_data = auto_organize_images(recursive=settings.get("recursive_scan", False))
     
     # Check if we found any images
     if media_data["images"]["count"] == 0:
@@ -756,26 +1084,23 @@ def create_slideshow_interactive():
         # Offer to create test images for demo purposes
         create_test = ask_question("Would you like to create test images for a demo", default="n", options=["y", "n"]) == "y"
         if create_test:
-            create_test_images()
-            media_data = auto_organize_images()  # Rescan after creating test images
+            # Only the test images are present now, so organize them without a rescan
+            media_data = auto_organize_images(image_paths=create_test_images())
             if media_data["images"]["count"] == 0:
                 if USE_COLORS:
                     print(f"\n{RED}Failed to create test images.{RESET}")
                 else:
                     print("\nFailed to create test images.")
-                input("\nPress Enter to return to the main menu...")
+                wait_for_key("\nPress Enter to return to the main menu...")
                 return
         else:
-            input("\nPress Enter to return to the main menu...")
+            wait_for_key("\nPress Enter to return to the main menu...")
             return
     
     # Display a status box with file analysis results
     if USE_COLORS:
         # Box style for media status
-        status_box_top = f"{LIGHT_GRAY}┌{'─' * (menu_width - 2)}┐{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
-        status_box_bottom = f"{LIGHT_GRAY}└{'─' * (menu_width - 2)}┘{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
-        status_side = f"{LIGHT_GRAY}│{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}|{RESET}"
-        divider = f"{LIGHT_GRAY}├{'─' * (menu_width - 2)}┤{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
+        status_box_top, status_box_bottom, status_side, divider = box_chrome(menu_width, USE_UNICODE)
         
         print("\n" + status_box_top)
         print(f"{status_side} {BOLD}Media Analysis Results{RESET}{' ' * (menu_width - 22)}{status_side}")
@@ -825,7 +1150,7 @@ def create_slideshow_interactive():
     else:
         # Non-colored version
         print(f"\nMedia Analysis Results")
-        print(f"-" * menu_width)
+        print(rule_line("-", menu_width))
         print(f"Images: {media_data['images']['count']} found")
         
         if media_data["images"]["groups"]["sequence"]:
@@ -836,7 +1161,7 @@ def create_slideshow_interactive():
         if media_data["images"]["groups"]["date"]:
             print(f"✓ Detected {len(media_data['images']['groups']['date'])} date-based groups")
         
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
         
         if media_data["audio"]["selected"]:
             audio_file = media_data["audio"]["selected"]
@@ -853,7 +1178,7 @@ def create_slideshow_interactive():
             else:
                 print(f"Audio: No audio files found")
         
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
     
     # Audio selection - if needed
     audio_file = media_data["audio"]["selected"]
@@ -914,7 +1239,7 @@ def create_slideshow_interactive():
                 print(f"\n{GRAY}Please add your audio file to the song/ directory and try again.{RESET}")
             else:
                 print("\nPlease add your audio file to the song/ directory and try again.")
-            input("\nPress Enter to return to the main menu...")
+            wait_for_key("\nPress Enter to return to the main menu...")
             return
     
     # Smart project name suggestion
@@ -930,8 +1255,7 @@ def create_slideshow_interactive():
     # If no good prefix, try date-based name
     if not suggested_name and media_data["images"]["groups"]["date"]:
         # Use the most common date
-        date_groups = media_data["images"]["groups"]["date"]
-        most_common_date = max(date_groups.values(), key=len)[0]["date"]
+        most_common_date = media_data["images"]["groups"]["date_sizes"].most_common(1)[0][0]
         suggested_name = f"Slideshow {most_common_date}"
     
     # Default fallback
@@ -945,13 +1269,13 @@ def create_slideshow_interactive():
         padding = (menu_width - len(section_title)) // 2
         if USE_UNICODE:
             print(f"{' ' * padding}{BOLD}{PURPLE}•{section_title}•{RESET}")
-            print(f"{GRAY}{'─' * menu_width}{RESET}")
+            print(f"{GRAY}{rule_line('─', menu_width)}{RESET}")
         else:
             print(f"{' ' * padding}{BOLD}{PURPLE}{section_title}{RESET}")
-            print(f"{GRAY}{'-' * menu_width}{RESET}")
+            print(f"{GRAY}{rule_line('-', menu_width)}{RESET}")
     else:
         print("Slideshow Settings")
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
     
     print()
     
@@ -1053,15 +1377,13 @@ def create_slideshow_interactive():
         padding = (menu_width - len(summary_title)) // 2
         if USE_UNICODE:
             print(f"{' ' * padding}{BOLD}{GREEN}•{summary_title}•{RESET}")
-            print(f"{GRAY}{'─' * menu_width}{RESET}")
+            print(f"{GRAY}{rule_line('─', menu_width)}{RESET}")
         else:
             print(f"{' ' * padding}{BOLD}{GREEN}{summary_title}{RESET}")
-            print(f"{GRAY}{'-' * menu_width}{RESET}")
+            print(f"{GRAY}{rule_line('-', menu_width)}{RESET}")
         
         # Box style for summary
-        summary_box_top = f"{LIGHT_GRAY}┌{'─' * (menu_width - 2)}┐{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
-        summary_box_bottom = f"{LIGHT_GRAY}└{'─' * (menu_width - 2)}┘{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
-        summary_side = f"{LIGHT_GRAY}│{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}|{RESET}"
+        summary_box_top, summary_box_bottom, summary_side, _ = box_chrome(menu_width, USE_UNICODE)
         
         # Function to create summary row
         def summary_row(label, value, extra=""):
@@ -1092,7 +1414,7 @@ def create_slideshow_interactive():
         print(summary_box_bottom)
     else:
         print("Slideshow Summary")
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
         print(f"Title:      {slideshow_title}")
         print(f"Resolution: {resolution}")
         print(f"Quality:    {quality}")
@@ -1105,7 +1427,7 @@ def create_slideshow_interactive():
         
         print(f"Images:     {media_data['images']['count']} images")
         print(f"Per slide:  {media_data['slide_duration']:.2f} seconds")
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
     
     print()
     
@@ -1119,7 +1441,7 @@ def create_slideshow_interactive():
             print(f"\n{GRAY}Encoding cancelled{RESET}")
         else:
             print("\nEncoding cancelled")
-        input("\nPress Enter to return to the main menu...")
+        wait_for_key("\nPress Enter to return to the main menu...")
         return
     
     # Save settings
@@ -1148,15 +1470,17 @@ def create_slideshow_interactive():
     else:
         print_styled(RED, "Encoding failed")
     
-    input("\nPress Enter to return to the main menu...")
+    wait_for_key("\nPress Enter to return to the main menu...")
 
-def create_encoding_script(slideshow_title, resolution, quality, output_filename, encoder, audio_file, image_list, slide_duration):
+def create_encoding_script(slideshow_title, resolution, quality, output_filename, encoder, audio_file, image_list, slide_duration, config_file=ENCODE_CONFIG_FILE):
     """
-    Create an encoding script file with the provided slideshow settings.
-    This generates the run_encode.py file with all necessary parameters.
+    Write the slideshow settings for the encoding script.
+    run_encode.py reads them from config_file; its path is returned. The
+    encode's working files go in the same directory as config_file.
     """
     # Create necessary directories
-    os.makedirs("temp", exist_ok=True)
+    work_dir = os.path.dirname(config_file)
+    os.makedirs(work_dir, exist_ok=True)
     
     # Always override quality to 'ultrafast' for maximum speed
     original_quality = quality
@@ -1166,262 +1490,20 @@ def create_encoding_script(slideshow_title, resolution, quality, output_filename
     if not any(hw in encoder for hw in ["videotoolbox", "nvenc", "qsv", "vaapi"]):
         encoder = "libx264"
     
-    # Build the encoding script content
-    script_content = f"""#!/usr/bin/env python3
-# SlideSonic (2025) - Encoding Script - MAXIMUM SPEED OPTIMIZATION
-# Generated on {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}
-
-import os
-import sys
-import time
-import subprocess
-from datetime import datetime
-import json
-
-# Slideshow settings
-TITLE = "{slideshow_title}"
-RESOLUTION = "{resolution}"
-QUALITY_PRESET = "{quality}"  # Using ultrafast preset for maximum speed
-OUTPUT_FILENAME = "{output_filename}"
-ENCODER = "{encoder}"
-AUDIO_FILE = {repr(audio_file) if audio_file else "None"}
-SLIDE_DURATION = {slide_duration}
-
-# Print optimization info
-print("SPEED OPTIMIZATION: Using maximum speed settings")
-print(f"ENCODER: {{ENCODER}} with PRESET: {{QUALITY_PRESET}}")
-
-# Ensure required directories exist
-os.makedirs("temp", exist_ok=True)
-os.makedirs("output", exist_ok=True)
-
-# Using smart-sorted image list
-image_files = {repr(image_list)}
-print(f"Using {{len(image_files)}} images in optimized order")
-
-if not image_files:
-    print("Error: No images found in images/original/ directory")
-    sys.exit(1)
-
-print(f"Found {{len(image_files)}} images")
-
-# Calculate duration per slide based on audio duration
-audio_duration = None
-if AUDIO_FILE:
-    try:
-        cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration', 
-               '-of', 'default=noprint_wrappers=1:nokey=1', AUDIO_FILE]
-        audio_duration = float(subprocess.check_output(cmd, text=True).strip())
-        print(f"Audio duration: {{audio_duration:.2f}} seconds")
-    except (subprocess.SubprocessError, ValueError):
-        print("Warning: Could not determine audio duration")
-
-# Use provided slide duration or calculate from audio
-slide_duration = SLIDE_DURATION
-if audio_duration:
-    # Make sure slides fit within audio, adjusting if necessary
-    total_duration = slide_duration * len(image_files)
-    if total_duration < audio_duration * 0.9:  # If much shorter than audio
-        # Can lengthen slide duration to better use the audio
-        slide_duration = min(6.0, audio_duration / len(image_files))
-        print(f"Adjusted slide duration to {{slide_duration:.2f}}s to better match audio")
-
-print(f"Using slide duration: {{slide_duration:.2f}} seconds")
-
-# Create temporary file list
-with open("temp/filelist.txt", "w") as f:
-    for img in image_files:
-        # Check if this is a full path or just a filename
-        if os.path.isabs(img) or os.path.dirname(img):
-            # Use absolute path or path relative to current directory
-            absolute_path = os.path.abspath(img)
-            f.write(f"file '{{absolute_path}}'\\n")
-        else:
-            # Just a filename, use IMAGE_DIR
-            f.write(f"file '{{os.path.abspath(os.path.join(\"images/original\", img))}}'\\n")
-        f.write(f"duration {{slide_duration}}\\n")
-    
-    # Add last image again to avoid premature ending
-    if image_files:
-        last_img = image_files[-1]
-        if os.path.isabs(last_img) or os.path.dirname(last_img):
-            # Use absolute path or path relative to current directory
-            absolute_path = os.path.abspath(last_img)
-            f.write(f"file '{{absolute_path}}'\\n")
-        else:
-            # Just a filename, use IMAGE_DIR
-            f.write(f"file '{{os.path.abspath(os.path.join(\"images/original\", last_img))}}'\\n")
-
-# Parse resolution
-width, height = map(int, RESOLUTION.split('x'))
-
-# Determine quality settings based on encoder
-crf_value = "30"  # Higher CRF = lower quality but faster encoding
-if ENCODER == "libx265":
-    crf_value = "35"  # HEVC uses different CRF scale - much higher for speed
-elif "av1" in ENCODER:
-    crf_value = "40"  # AV1 uses different CRF scale - much higher for speed
-
-# Build FFmpeg command with maximum speed optimizations
-ffmpeg_cmd = [
-    "ffmpeg", "-y",
-    "-f", "concat", "-safe", "0", "-i", "temp/filelist.txt",
-]
-
-# Add audio if available
-if AUDIO_FILE:
-    ffmpeg_cmd.extend(["-i", AUDIO_FILE])
-
-# Add video settings optimized for speed
-ffmpeg_cmd.extend([
-    "-c:v", ENCODER,
-    "-preset", QUALITY_PRESET,
-    "-crf", crf_value,
-    "-pix_fmt", "yuv420p",
-    "-g", "999999",           # Reduce keyframes to bare minimum
-    "-keyint_min", "999999",  # Minimize keyframes for speed
-    "-sc_threshold", "0",     # Disable scene change detection for speed
-    "-tune", "fastdecode",    # Optimize for decode speed
-])
-
-# Additional encoder-specific optimizations for speed
-if "videotoolbox" in ENCODER:
-    # Apple VideoToolbox specific optimizations for speed
-    ffmpeg_cmd.extend([
-        "-allow_sw", "1",       # Allow software fallback
-        "-realtime", "1",       # Prioritize realtime encoding
-        "-b:v", "1M",           # Use fixed bitrate mode for speed
-        "-maxrate", "1M",       # Limit max bitrate
-        "-bufsize", "1M",       # Small buffer for speed
-    ])
-elif "nvenc" in ENCODER:
-    # NVIDIA NVENC specific optimizations for speed
-    ffmpeg_cmd.extend([
-        "-preset", "p1",         # Fastest preset for NVENC
-        "-tune", "ll",           # Low latency tuning
-        "-rc", "constqp",        # Constant QP mode for speed
-        "-qp", "32",             # Higher QP = faster encoding
-        "-b:v", "0",             # Disable bitrate control
-    ])
-elif "qsv" in ENCODER:
-    # Intel QuickSync specific optimizations
-    ffmpeg_cmd.extend([
-        "-low_power", "1",      # Use low power mode for speed
-        "-async_depth", "1",    # Minimize frame queue
-    ])
-else:
-    # Software encoder optimizations
-    ffmpeg_cmd.extend([
-        "-threads", "0",         # Use all available threads
-        "-slices", "4",          # Slice frames for parallel encoding
-        "-flags", "+cgop",       # Closed GOP for faster encoding
-        "-movflags", "+faststart", # Optimize for streaming
-        "-bf", "0",              # No B-frames for speed
-        "-refs", "1",            # Minimal reference frames
-    ])
-
-# Add fast audio encoding settings if available
-if AUDIO_FILE:
-    ffmpeg_cmd.extend([
-        "-c:a", "aac",
-        "-b:a", "128k",         # Lower audio bitrate for speed
-        "-ar", "44100",         # Lower sample rate for speed
-    ])
-
-# Optimize filter settings for speed
-ffmpeg_cmd.extend([
-    "-vf", f"scale={{RESOLUTION}}:flags=fast_bilinear",  # Fast scaling algorithm
-    "output/" + OUTPUT_FILENAME
-])
-
-# Save metadata about the encoding
-metadata = {{
-    "title": TITLE,
-    "created": datetime.now().isoformat(),
-    "settings": {{
-        "resolution": RESOLUTION,
-        "quality": QUALITY_PRESET,
-        "encoder": ENCODER,
+    # run_encode.py is a static script; only its settings change per slideshow
+    config = {
+        "title": slideshow_title,
+        "resolution": resolution,
+        "quality": quality,
+        "output_filename": output_filename,
+        "encoder": encoder,
+        "audio_file": audio_file or None,
         "slide_duration": slide_duration,
-        "total_duration": slide_duration * len(image_files),
-        "image_count": len(image_files),
-        "audio": AUDIO_FILE is not None
-    }}
-}}
-
-with open("temp/encode_metadata.json", "w") as f:
-    json.dump(metadata, f, indent=2)
-
-# Log the command
-print(f"Running FFmpeg command: {{' '.join(ffmpeg_cmd)}}")
-
-# Create log file - IMPORTANT: This must match the path expected by monitor_encoding.py
-log_file = "temp/ffmpeg_output.log"
-
-# Run FFmpeg
-try:
-    # First, create a subprocess that runs FFmpeg and redirects output to a log file
-    print(f"Starting encoding process...")
-    print(f"For detailed progress, you can view the log file: {{log_file}}")
-    
-    # Open log file for FFmpeg output
-    log_file_handle = open(log_file, "w")
-    
-    # Start the FFmpeg process
-    process = subprocess.Popen(
-        ffmpeg_cmd, 
-        stdout=log_file_handle, 
-        stderr=subprocess.STDOUT, 
-        universal_newlines=True
-    )
-    
-    # Record start time
-    start_time = time.time()
-    
-    # Write the PID to a file for the monitor to pick up
-    with open("temp/ffmpeg_pid.txt", "w") as f:
-        f.write(str(process.pid))
-    
-    # Wait for the process to complete
-    process.wait()
-    returncode = process.returncode
-    
-    # Calculate elapsed time
-    elapsed_time = time.time() - start_time
-    
-    # Close log file
-    log_file_handle.close()
-    
-    # Final output based on success or failure
-    if returncode == 0:
-        print(f"\\n\\033[38;5;35m✓\\033[0m \\033[1mEncoding completed successfully\\033[0m in {{elapsed_time:.2f}} seconds")
-        print(f"Output: output/{{OUTPUT_FILENAME}}")
-        
-        # Show file size
-        try:
-            file_size = os.path.getsize("output/" + OUTPUT_FILENAME)
-            print(f"File size: {{file_size / (1024*1024):.2f}} MB")
-        except:
-            pass
-    else:
-        print(f"\\n\\033[38;5;196m✗\\033[0m \\033[1mEncoding failed\\033[0m with code {{returncode}}")
-        print(f"Check log file for details: {{log_file}}")
-except Exception as e:
-    print(f"Error running FFmpeg: {{e}}")
-    if 'log_file_handle' in locals() and not log_file_handle.closed:
-        log_file_handle.close()
-"""
-
-    # Write the script to the run_encode.py file
-    script_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "run_encode.py")
-    with open(script_path, "w") as f:
-        f.write(script_content)
-    
-    # Make the script executable
-    try:
-        os.chmod(script_path, 0o755)
-    except Exception:
-        pass
+        "images": list(image_list),
+        "work_dir": work_dir
+    }
+    with open(config_file, "w") as f:
+        json.dump(config, f)
     
     # Save the metadata for reference
     metadata = {
@@ -1436,16 +1518,15 @@ except Exception as e:
         "timestamp": datetime.now().isoformat()
     }
     
-    os.makedirs("temp", exist_ok=True)
-    with open("temp/slideshow_config.json", "w") as f:
+    with open(os.path.join(work_dir, "slideshow_config.json"), "w") as f:
         json.dump(metadata, f, indent=2)
     
-    return script_path
+    return _RUN_ENCODE_PATH
 
 def run_encoding():
     """Run the encoding script with progress monitoring, optimized for maximum speed"""
-    script_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "run_encode.py")
-    monitor_path = os.path.join(os.path.dirname(os.path.realpath(__file__)), "monitor_encoding.py")
+    script_path = _RUN_ENCODE_PATH
+    monitor_path = _MONITOR_PATH
     
     # Make sure temp directory exists
     os.makedirs("temp", exist_ok=True)
@@ -1458,17 +1539,21 @@ def run_encoding():
     print_styled(GRAY, "  Quality is reduced to achieve the fastest possible encoding speed")
     
     try:
+        # The monitor owns the terminal, so the script's own output goes straight
+        # to a log file as raw bytes instead of a pipe nobody drains
+        script_log = open(ENCODE_SCRIPT_LOG, "wb", buffering=0)
+        
         # Set high process priority if possible
         high_priority_cmd = []
         if platform.system() == "Windows":
             # On Windows, use start command with high priority
-            high_priority_cmd = ["start", "/HIGH", "/B", sys.executable, script_path]
+            high_priority_cmd = ["start", "/HIGH", "/B", sys.executable, script_path, ENCODE_CONFIG_FILE]
         elif platform.system() == "Darwin":  # macOS
             # On Mac, use nice command with low value (higher priority)
-            high_priority_cmd = ["nice", "-n", "-10", sys.executable, script_path]
+            high_priority_cmd = ["nice", "-n", "-10", sys.executable, script_path, ENCODE_CONFIG_FILE]
         elif platform.system() == "Linux":
             # On Linux, use nice command with low value (higher priority)
-            high_priority_cmd = ["nice", "-n", "-10", sys.executable, script_path]
+            high_priority_cmd = ["nice", "-n", "-10", sys.executable, script_path, ENCODE_CONFIG_FILE]
         
         # Use high priority if we could set it up, otherwise use normal priority
         if high_priority_cmd:
@@ -1477,37 +1562,34 @@ def run_encoding():
                 # For Mac/Linux, may require sudo, catch permission errors
                 encoding_process = subprocess.Popen(
                     high_priority_cmd,
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    bufsize=1
+                    stdout=script_log,
+                    stderr=subprocess.STDOUT
                 )
             except (PermissionError, subprocess.SubprocessError):
                 # Fall back to normal priority
                 print_styled(YELLOW, "  Could not set high priority (permission denied), using normal priority")
                 encoding_process = subprocess.Popen(
-                    [sys.executable, script_path],
-                    stdout=subprocess.PIPE,
-                    stderr=subprocess.STDOUT,
-                    universal_newlines=True,
-                    bufsize=1
+                    [sys.executable, script_path, ENCODE_CONFIG_FILE],
+                    stdout=script_log,
+                    stderr=subprocess.STDOUT
                 )
         else:
             # Use normal priority
             encoding_process = subprocess.Popen(
-                [sys.executable, script_path],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.STDOUT,
-                universal_newlines=True,
-                bufsize=1
+                [sys.executable, script_path, ENCODE_CONFIG_FILE],
+                stdout=script_log,
+                stderr=subprocess.STDOUT
             )
             
+        # The child holds its own handle to the log now
+        script_log.close()
+        
         # Wait a moment for the process to start
         time.sleep(1)
         
         # Check if the process is still running
         if encoding_process.poll() is not None:
-            print_styled(RED, "Encoding process failed to start or exited immediately")
+            print_styled(RED, f"Encoding process failed to start or exited immediately (see {ENCODE_SCRIPT_LOG})")
             return False
         
         # Start monitoring
@@ -1546,6 +1628,33 @@ def run_encoding():
         print_styled(RED, f"Error running encoding: {e}")
         return False
 
+@lru_cache(maxsize=1)
+def load_run_encode():
+    """Load run_encode.py from beside this file, whether or not src/ is on sys.path"""
+    spec = importlib.util.spec_from_file_location("run_encode", _RUN_ENCODE_PATH)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+def run_encoding_job(config_file):
+    """Run one encode without the monitor, for jobs that run side by side
+    
+    FFmpeg is started directly from the command run_encode.py would build,
+    without a Python interpreter per job. Its output goes to ffmpeg_output.log
+    next to config_file. Returns True when the encode succeeded.
+    """
+    run_encode = load_run_encode()
+    
+    config = run_encode.load_config(config_file)
+    log_path = os.path.join(config["work_dir"], "ffmpeg_output.log")
+    with open(log_path, "w") as ffmpeg_log:
+        ffmpeg_cmd, filelist, metadata = run_encode.build_encode(
+            config, log=lambda line: ffmpeg_log.write(line + "\n"))
+        run_encode.write_work_files(config, filelist, metadata)
+        ffmpeg_log.flush()
+        process = subprocess.run(ffmpeg_cmd, stdout=ffmpeg_log, stderr=subprocess.STDOUT)
+    return process.returncode == 0
+
 def show_help():
     """Show help information"""
     show_banner()
@@ -1553,14 +1662,14 @@ def show_help():
     print_styled(BOLD, "SlideSonic (2025) Help")
     print()
     
-    print_styled(BOLD + BLUE, "Basic Usage:")
+    print_styled(BOLD_BLUE, "Basic Usage:")
     print_styled(GRAY, "1. Place your images in the 'images/original/' directory")
     print_styled(GRAY, "2. Place your audio file in the 'song/' directory")
     print_styled(GRAY, "3. Run './slidesonic' to start the application")
     print_styled(GRAY, "4. Follow the on-screen instructions")
     print()
     
-    print_styled(BOLD + BLUE, "Command Line Options:")
+    print_styled(BOLD_BLUE, "Command Line Options:")
     print_styled(GRAY, "./slidesonic               - Launch main menu")
     print_styled(GRAY, "./slidesonic --help        - Show this help")
     print_styled(GRAY, "./slidesonic --quick       - Launch interactive mode directly")
@@ -1570,16 +1679,16 @@ def show_help():
     print_styled(GRAY, "./slidesonic --accessibility - Enable accessibility features")
     print()
     
-    print_styled(BOLD + BLUE, "Quality Modes:")
+    print_styled(BOLD_BLUE, "Quality Modes:")
     print_styled(GRAY, "1. Maximum Performance - Fastest encoding, suitable for quick previews")
     print_styled(GRAY, "2. Standard Quality - Balanced quality/speed, good for most purposes")
     print_styled(GRAY, "3. Ultra High Quality - Best quality, slower encoding")
     print()
     
-    print_styled(BOLD + BLUE, "For More Information:")
+    print_styled(BOLD_BLUE, "For More Information:")
     print_styled(GRAY, "Visit: https://github.com/chama-x/SlideSonic-2025")
     
-    input("\nPress Enter to return to the main menu...")
+    wait_for_key("\nPress Enter to return to the main menu...")
 
 def show_main_menu():
     """Show the main menu with responsive layout"""
@@ -1602,7 +1711,7 @@ def show_main_menu():
         quick_start_ready = images_ready
         
         # Get terminal width for responsive content
-        width = shutil.get_terminal_size().columns
+        width = terminal_width()
         # Calculate responsive menu width - adapt to terminal size
         menu_width = min(75, max(40, width - 10))
         
@@ -1612,13 +1721,13 @@ def show_main_menu():
             padding = (menu_width - len(header)) // 2
             if USE_UNICODE:
                 print(f"{' ' * padding}{BOLD}{BLUE}•{header}•{RESET}")
-                print(f"{GRAY}{'─' * menu_width}{RESET}")
+                print(f"{GRAY}{rule_line('─', menu_width)}{RESET}")
             else:
                 print(f"{' ' * padding}{BOLD}{BLUE}{header}{RESET}")
-                print(f"{GRAY}{'-' * menu_width}{RESET}")
+                print(f"{GRAY}{rule_line('-', menu_width)}{RESET}")
         else:
             print(f"Menu Options")
-            print("-" * menu_width)
+            print(rule_line("-", menu_width))
         
         # Show media status in a cleaner box style
         if USE_COLORS and USE_UNICODE:
@@ -1758,7 +1867,7 @@ def media_management_menu():
         show_banner()
         
         # Get terminal width for centered content
-        width = shutil.get_terminal_size().columns
+        width = terminal_width()
         menu_width = min(60, width - 10)  # Keep menu width reasonable
         
         # Display elegant menu header
@@ -1767,13 +1876,13 @@ def media_management_menu():
             padding = (menu_width - len(header)) // 2
             if USE_UNICODE:
                 print(f"{' ' * padding}{BOLD}{PURPLE}•{header}•{RESET}")
-                print(f"{GRAY}{'─' * menu_width}{RESET}")
+                print(f"{GRAY}{rule_line('─', menu_width)}{RESET}")
             else:
                 print(f"{' ' * padding}{BOLD}{PURPLE}{header}{RESET}")
-                print(f"{GRAY}{'-' * menu_width}{RESET}")
+                print(f"{GRAY}{rule_line('-', menu_width)}{RESET}")
         else:
             print("Media Management")
-            print("-" * menu_width)
+            print(rule_line("-", menu_width))
         
         print()
         
@@ -1817,7 +1926,7 @@ def media_management_menu():
             import_audio()
         elif choice == "3":
             create_test_images()
-            input("\nPress Enter to continue...")
+            wait_for_key("\nPress Enter to continue...")
         elif choice == "4":
             organize_images()
         elif choice == "5":
@@ -1836,7 +1945,7 @@ def quick_create_slideshow():
     show_banner()
     
     # Get terminal width for centered content
-    width = shutil.get_terminal_size().columns
+    width = terminal_width()
     menu_width = min(80, width - 10)
     
     # Display section header
@@ -1845,26 +1954,25 @@ def quick_create_slideshow():
         padding = (menu_width - len(section_title)) // 2
         if USE_UNICODE:
             print(f"{' ' * padding}{BOLD}{BLUE}•{section_title}•{RESET}")
-            print(f"{GRAY}{'─' * menu_width}{RESET}")
+            print(f"{GRAY}{rule_line('─', menu_width)}{RESET}")
         else:
             print(f"{' ' * padding}{BOLD}{BLUE}{section_title}{RESET}")
-            print(f"{GRAY}{'-' * menu_width}{RESET}")
+            print(f"{GRAY}{rule_line('-', menu_width)}{RESET}")
     else:
         print("Quick Slideshow")
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
     
     print()
     
-    # Show a spinner while scanning
-    show_spinner("Scanning for media files", 1)
-    
     # Auto-organize images and find matching audio
     if USE_COLORS:
         print(f"{BOLD}Analyzing media files...{RESET}")
     else:
         print("Analyzing media files...")
     
-    media_data = auto_organize_images(recursive=True)
+    # Show a spinner while scanning
+    with Spinner("Scanning for media files"):
+        media_data = auto_organize_images(recursive=True)
     
     # Check if we found any images
     if media_data["images"]["count"] == 0:
@@ -1877,25 +1985,22 @@ def quick_create_slideshow():
         
         create_test = ask_question("Would you like to create test images for a demo", default="y", options=["y", "n"]) == "y"
         if create_test:
-            create_test_images()
-            media_data = auto_organize_images()  # Rescan after creating test images
+            # Only the test images are present now, so organize them without a rescan
+            media_data = auto_organize_images(image_paths=create_test_images())
             if media_data["images"]["count"] == 0:
                 if USE_COLORS:
                     print(f"\n{RED}Failed to create test images.{RESET}")
                 else:
                     print("\nFailed to create test images.")
-                input("\nPress Enter to return to the main menu...")
+                wait_for_key("\nPress Enter to return to the main menu...")
                 return
         else:
-            input("\nPress Enter to return to the main menu...")
+            wait_for_key("\nPress Enter to return to the main menu...")
             return
     
     # Display status info in an elegant box
     if USE_COLORS:
-        status_box_top = f"{LIGHT_GRAY}┌{'─' * (menu_width - 2)}┐{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
-        status_box_bottom = f"{LIGHT_GRAY}└{'─' * (menu_width - 2)}┘{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
-        status_side = f"{LIGHT_GRAY}│{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}|{RESET}"
-        divider = f"{LIGHT_GRAY}├{'─' * (menu_width - 2)}┤{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
+        status_box_top, status_box_bottom, status_side, divider = box_chrome(menu_width, USE_UNICODE)
         
         print("\n" + status_box_top)
         print(f"{status_side} {BOLD}Media Analysis{RESET}{' ' * (menu_width - 15)}{status_side}")
@@ -1922,7 +2027,7 @@ def quick_create_slideshow():
         print(status_box_bottom)
     else:
         print(f"\nMedia Analysis:")
-        print(f"-" * menu_width)
+        print(rule_line("-", menu_width))
         print(f"✓ Found {media_data['images']['count']} images")
         
         if media_data["audio"]["selected"]:
@@ -1934,7 +2039,7 @@ def quick_create_slideshow():
                 print(f"✓ Audio duration: {int(mins)}:{int(secs):02d}")
         else:
             print("⚠ No audio selected")
-        print(f"-" * menu_width)
+        print(rule_line("-", menu_width))
     
     # Smart title suggestion
     suggested_name = ""
@@ -1948,10 +2053,8 @@ def quick_create_slideshow():
     
     if not suggested_name and media_data["images"]["groups"]["date"]:
         # Find the most common date
-        largest_date_group = max(media_data["images"]["groups"]["date"].values(), key=len)
-        if largest_date_group:
-            date_str = largest_date_group[0]["date"]
-            suggested_name = f"Slideshow {date_str}"
+        date_str = media_data["images"]["groups"]["date_sizes"].most_common(1)[0][0]
+        suggested_name = f"Slideshow {date_str}"
     
     # Default fallback
     if not suggested_name:
@@ -1974,14 +2077,12 @@ def quick_create_slideshow():
         padding = (menu_width - len(summary_title)) // 2
         if USE_UNICODE:
             print(f"\n{' ' * padding}{BOLD}{GREEN}•{summary_title}•{RESET}")
-            print(f"{GRAY}{'─' * menu_width}{RESET}")
+            print(f"{GRAY}{rule_line('─', menu_width)}{RESET}")
         else:
             print(f"\n{' ' * padding}{BOLD}{GREEN}{summary_title}{RESET}")
-            print(f"{GRAY}{'-' * menu_width}{RESET}")
+            print(f"{GRAY}{rule_line('-', menu_width)}{RESET}")
         
-        summary_box_top = f"{LIGHT_GRAY}┌{'─' * (menu_width - 2)}┐{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
-        summary_box_bottom = f"{LIGHT_GRAY}└{'─' * (menu_width - 2)}┘{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}+{'-' * (menu_width - 2)}+{RESET}"
-        summary_side = f"{LIGHT_GRAY}│{RESET}" if USE_UNICODE else f"{LIGHT_GRAY}|{RESET}"
+        summary_box_top, summary_box_bottom, summary_side, _ = box_chrome(menu_width, USE_UNICODE)
         
         # Calculate optimal settings
         resolution = "1920x1080"  # Default to 1080p
@@ -2049,7 +2150,7 @@ def quick_create_slideshow():
             slide_duration = max(2.0, min(6.0, raw_duration))
         
         print("\nSlideshow Configuration:")
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
         print(f"Title:      {title}")
         print(f"Resolution: {resolution}")
         print(f"Quality:    {quality}")
@@ -2061,7 +2162,7 @@ def quick_create_slideshow():
         
         print(f"Images:     {media_data['images']['count']}")
         print(f"Per slide:  {slide_duration:.2f} seconds")
-        print("-" * menu_width)
+        print(rule_line("-", menu_width))
     
     print()
     
@@ -2075,7 +2176,7 @@ def quick_create_slideshow():
             print(f"\n{GRAY}Slideshow creation cancelled{RESET}")
         else:
             print("\nSlideshow creation cancelled")
-        input("\nPress Enter to return to the main menu...")
+        wait_for_key("\nPress Enter to return to the main menu...")
         return
     
     # Create encoding script
@@ -2143,23 +2244,25 @@ def batch_process_slideshows():
     # Look for subdirectories
     batch_dirs = []
     if os.path.exists("images"):
-        for item in os.listdir("images"):
+        with os.scandir("images") as entries:
+            subdirs = [entry.name for entry in entries if entry.is_dir() and entry.name != "original"]
+        for item in subdirs:
             full_path = os.path.join("images", item)
-            if os.path.isdir(full_path) and item != "original":
-                # Check if this directory has images
-                image_count = count_files(full_path, IMAGE_EXTENSIONS)
-                if image_count > 0:
-                    batch_dirs.append({
-                        "name": item,
-                        "path": full_path,
-                        "image_count": image_count
-                    })
+            # Scan each directory once; the encode step reuses this result
+            dir_images = smart_scan_directory(full_path, IMAGE_EXTENSIONS)
+            if dir_images["count"] > 0:
+                batch_dirs.append({
+                    "name": item,
+                    "path": full_path,
+                    "image_count": dir_images["count"],
+                    "images": dir_images
+                })
     
     if not batch_dirs:
         print_styled(RED, "No subdirectories with images found in the images/ directory")
         print_styled(GRAY, "To use batch processing, create subdirectories in the images/ folder")
         print_styled(GRAY, "Each subdirectory should contain images for a separate slideshow")
-        input("\nPress Enter to return to the main menu...")
+        wait_for_key("\nPress Enter to return to the main menu...")
         return
     
     # Show found directories
@@ -2192,10 +2295,10 @@ def batch_process_slideshows():
     
     # Process audio choice
     print()
-    audio_mode = ask_question("Audio selection: auto/common/none", default="auto")
+    audio_mode = ask_question("Audio selection: auto/common/none", default="auto").lower()
     
     common_audio = None
-    if audio_mode.lower() == "common":
+    if audio_mode == "common":
         # Let user select one audio file for all slideshows
         audio_files = smart_scan_directory("song", AUDIO_EXTENSIONS)
         if audio_files["count"] > 0:
@@ -2219,14 +2322,16 @@ def batch_process_slideshows():
     # Auto settings
     hw_info = get_hardware_info()
     
+    high_end = hw_info.get("apple_silicon") or (hw_info.get("physical_cores") or 0) >= 8
+    
     # Set resolution based on hardware
-    if hw_info.get("apple_silicon") or (HAVE_PSUTIL and psutil.cpu_count(logical=False) >= 8):
+    if high_end:
         resolution = "1920x1080"  # 1080p for good hardware
     else:
         resolution = "1280x720"   # 720p for lower-end hardware
     
     # Set quality based on hardware
-    if hw_info.get("apple_silicon") or (HAVE_PSUTIL and psutil.cpu_count(logical=False) >= 8):
+    if high_end:
         quality = "medium"      # Better quality for good hardware
     else:
         quality = "faster"      # Faster preset for lower-end hardware
@@ -2234,22 +2339,32 @@ def batch_process_slideshows():
     # Get best encoder
     encoder = detect_best_encoder()
     
-    # Process each directory
-    success_count = 0
+    # The audio library is the same for every directory, so scan it once
+    if audio_mode == "auto":
+        audio_files = smart_scan_directory("song", AUDIO_EXTENSIONS)
+    
+    # One timestamp for the whole batch; the per-directory counter keeps names
+    # unique even when two encodes finish within the same second
+    batch_timestamp = datetime.now().strftime('%Y%m%d_%H%M%S')
+    
+    # Set up every directory's encode first, then run them side by side.
+    # Hardware encoders handle a couple of sessions at once; software encodes
+    # already thread internally, so each gets a share of the cores
+    jobs = []
     for i, dir_info in enumerate(dirs_to_process, 1):
         print()
-        print_styled(BOLD, f"Processing directory {i}/{len(dirs_to_process)}: {dir_info['name']}")
+        print_styled(BOLD, f"Preparing directory {i}/{len(dirs_to_process)}: {dir_info['name']}")
         
-        # Analyze directory
-        dir_images = smart_scan_directory(dir_info['path'], IMAGE_EXTENSIONS)
+        # Already analyzed while listing the directories
+        dir_images = dir_info["images"]
+        image_order = [f["path"] for f in sorted(dir_images["files"], key=lambda x: x["name"])]
         
         # Get audio based on mode
         audio_file = None
-        if audio_mode.lower() == "auto":
+        if audio_mode == "auto":
             # Find best match for this directory
-            audio_files = smart_scan_directory("song", AUDIO_EXTENSIONS)
             audio_file = find_matching_audio(dir_images, audio_files)
-        elif audio_mode.lower() == "common" and common_audio:
+        elif audio_mode == "common" and common_audio:
             audio_file = common_audio
         
         # Get audio duration if available
@@ -2274,7 +2389,7 @@ def batch_process_slideshows():
         if batch_prefix:
             output_name = f"{batch_prefix}_{output_name}"
         
-        output_filename = f"{output_name}_{datetime.now().strftime('%Y%m%d_%H%M%S')}.mp4"
+        output_filename = f"{output_name}_{batch_timestamp}_{i:03d}.mp4"
         
         # Show info
         print_styled(CYAN, f"Images:     {dir_images['count']} images")
@@ -2285,7 +2400,8 @@ def batch_process_slideshows():
         else:
             print_styled(YELLOW, "No audio file selected")
         
-        # Create encoding script
+        # Each job writes its settings and working files to its own directory
+        config_file = f"temp/batch/{i:03d}/encode_config.json"
         create_encoding_script(
             output_name, 
             resolution, 
@@ -2293,17 +2409,38 @@ def batch_process_slideshows():
             output_filename, 
             encoder, 
             audio_file,
-            dir_images["suggested_order"],
-            slide_duration
+            image_order,
+            slide_duration,
+            config_file=config_file
         )
-        
-        # Run encoding
-        try:
-            run_encoding()
-            print_styled(GREEN, f"✓ Successfully created slideshow: {output_filename}")
-            success_count += 1
-        except Exception as e:
-            print_styled(RED, f"✗ Failed to create slideshow for {dir_info['name']}: {e}")
+        jobs.append((dir_info, output_filename, config_file))
+    
+    if encoder.startswith("lib"):
+        max_parallel = max(1, (os.cpu_count() or 1) // 4)
+    else:
+        max_parallel = 2
+    max_parallel = min(max_parallel, len(jobs))
+    
+    print()
+    print_styled(BOLD, f"Encoding {len(jobs)} slideshows, {max_parallel} at a time...")
+    
+    # Run the encodes; each one is its own ffmpeg process, so threads are
+    # enough to keep them going
+    success_count = 0
+    with ThreadPoolExecutor(max_workers=max_parallel) as executor:
+        futures = {executor.submit(run_encoding_job, config_file): (dir_info, output_filename, config_file)
+                   for dir_info, output_filename, config_file in jobs}
+        for future in as_completed(futures):
+            dir_info, output_filename, config_file = futures[future]
+            try:
+                if future.result():
+                    print_styled(GREEN, f"✓ Successfully created slideshow: {output_filename}")
+                    success_count += 1
+                else:
+                    log_path = os.path.join(os.path.dirname(config_file), "ffmpeg_output.log")
+                    print_styled(RED, f"✗ Failed to create slideshow for {dir_info['name']} (see {log_path})")
+            except Exception as e:
+                print_styled(RED, f"✗ Failed to create slideshow for {dir_info['name']}: {e}")
     
     # Show summary
     print()
@@ -2311,7 +2448,7 @@ def batch_process_slideshows():
     print_styled(GREEN if success_count == len(dirs_to_process) else YELLOW, 
                 f"Successfully created {success_count}/{len(dirs_to_process)} slideshows")
     
-    input("\nPress Enter to return to the main menu...")
+    wait_for_key("\nPress Enter to return to the main menu...")
 
 def import_images():
     """Import images from another directory"""
@@ -2323,17 +2460,18 @@ def import_images():
     source_dir = ask_question("Enter the path to the directory containing images", default="")
     if not source_dir or not os.path.isdir(source_dir):
         print_styled(RED, "Invalid directory path")
-        input("\nPress Enter to return to the menu...")
+        wait_for_key("\nPress Enter to return to the menu...")
         return
     
     # Check if the source directory has images
-    image_files = [f for f in os.listdir(source_dir) 
-                 if os.path.isfile(os.path.join(source_dir, f)) and 
-                 any(f.lower().endswith(ext) for ext in IMAGE_EXTENSIONS)]
+    variants = suffix_variants(IMAGE_EXTENSIONS)
+    with os.scandir(source_dir) as entries:
+        image_files = [entry.name for entry in entries
+                 if entry.is_file() and has_suffix(entry.name, variants)]
     
     if not image_files:
         print_styled(RED, "No image files found in the specified directory")
-        input("\nPress Enter to return to the menu...")
+        wait_for_key("\nPress Enter to return to the menu...")
         return
     
     print_styled(GREEN, f"Found {len(image_files)} image files")
@@ -2354,24 +2492,29 @@ def import_images():
     print()
     print_styled(BOLD, f"Copying {len(image_files)} files to {target_dir}...")
     
-    import shutil
     copied = 0
-    for filename in image_files:
+    total = len(image_files)
+    write, flush = sys.stdout.write, sys.stdout.flush
+    for index, filename in enumerate(image_files, 1):
         source_path = os.path.join(source_dir, filename)
         target_path = os.path.join(target_dir, filename)
         
         try:
-            shutil.copy2(source_path, target_path)
+            link_or_copy(source_path, target_path)
             copied += 1
-            sys.stdout.write(f"\rCopied {copied}/{len(image_files)} files...")
-            sys.stdout.flush()
         except Exception as e:
             print_styled(RED, f"\nError copying {filename}: {e}")
+        
+        # Redraw every 16 files, and after the last one even if some failed,
+        # so the terminal doesn't pace the import
+        if (index & 15) == 0 or index == total:
+            write(f"\rCopied {copied}/{total} files...")
+            flush()
     
     print()
     print_styled(GREEN, f"✓ Successfully imported {copied}/{len(image_files)} images to {target_dir}")
     
-    input("\nPress Enter to return to the menu...")
+    wait_for_key("\nPress Enter to return to the menu...")
 
 def import_audio():
     """Import audio files from another directory"""
@@ -2383,17 +2526,18 @@ def import_audio():
     source_dir = ask_question("Enter the path to the directory containing audio files", default="")
     if not source_dir or not os.path.isdir(source_dir):
         print_styled(RED, "Invalid directory path")
-        input("\nPress Enter to return to the menu...")
+        wait_for_key("\nPress Enter to return to the menu...")
         return
     
     # Check if the source directory has audio files
-    audio_files = [f for f in os.listdir(source_dir) 
-                 if os.path.isfile(os.path.join(source_dir, f)) and 
-                 any(f.lower().endswith(ext) for ext in AUDIO_EXTENSIONS)]
+    variants = suffix_variants(AUDIO_EXTENSIONS)
+    with os.scandir(source_dir) as entries:
+        audio_files = [entry.name for entry in entries
+                 if entry.is_file() and has_suffix(entry.name, variants)]
     
     if not audio_files:
         print_styled(RED, "No audio files found in the specified directory")
-        input("\nPress Enter to return to the menu...")
+        wait_for_key("\nPress Enter to return to the menu...")
         return
     
     print_styled(GREEN, f"Found {len(audio_files)} audio files")
@@ -2406,24 +2550,29 @@ def import_audio():
     print()
     print_styled(BOLD, f"Copying {len(audio_files)} files to {target_dir}...")
     
-    import shutil
     copied = 0
-    for filename in audio_files:
+    total = len(audio_files)
+    write, flush = sys.stdout.write, sys.stdout.flush
+    for index, filename in enumerate(audio_files, 1):
         source_path = os.path.join(source_dir, filename)
         target_path = os.path.join(target_dir, filename)
         
         try:
-            shutil.copy2(source_path, target_path)
+            link_or_copy(source_path, target_path)
             copied += 1
-            sys.stdout.write(f"\rCopied {copied}/{len(audio_files)} files...")
-            sys.stdout.flush()
         except Exception as e:
             print_styled(RED, f"\nError copying {filename}: {e}")
+        
+        # Redraw every 16 files, and after the last one even if some failed,
+        # so the terminal doesn't pace the import
+        if (index & 15) == 0 or index == total:
+            write(f"\rCopied {copied}/{total} files...")
+            flush()
     
     print()
     print_styled(GREEN, f"✓ Successfully imported {copied}/{len(audio_files)} audio files to {target_dir}")
     
-    input("\nPress Enter to return to the menu...")
+    wait_for_key("\nPress Enter to return to the menu...")
 
 def organize_images():
     """Organize existing images into folders based on patterns"""
@@ -2432,19 +2581,16 @@ def organize_images():
     print_styled(BOLD, "Organize Images")
     print()
     
-    # Check if we have images
-    image_count = count_files("images/original", IMAGE_EXTENSIONS)
+    # Check if we have images; one scan serves both the count and the analysis
+    images = smart_scan_directory("images/original", IMAGE_EXTENSIONS)
+    image_count = images["count"]
     if image_count == 0:
         print_styled(RED, "No images found in images/original/ directory")
-        input("\nPress Enter to return to the menu...")
+        wait_for_key("\nPress Enter to return to the menu...")
         return
     
     print_styled(GREEN, f"Found {image_count} images in images/original/")
     
-    # Analyze images
-    print_styled(GRAY, "Analyzing images...")
-    images = smart_scan_directory("images/original", IMAGE_EXTENSIONS)
-    
     # Show grouping options
     print()
     print_styled(BOLD, "Available Grouping Options:")
@@ -2488,11 +2634,11 @@ def organize_images():
             method = grouping_methods[method_idx]
         else:
             print_styled(RED, "Invalid choice")
-            input("\nPress Enter to return to the menu...")
+            wait_for_key("\nPress Enter to return to the menu...")
             return
     except (ValueError, IndexError):
         print_styled(RED, "Invalid choice")
-        input("\nPress Enter to return to the menu...")
+        wait_for_key("\nPress Enter to return to the menu...")
         return
     
     # Handle grouping methods
@@ -2515,7 +2661,61 @@ def organize_images():
         # Create equal-sized groups
         organize_equal_groups(images["files"], num_groups)
     
-    input("\nPress Enter to return to the menu...")
+    wait_for_key("\nPress Enter to return to the menu...")
+
+@lru_cache(maxsize=1)
+def copy_executor():
+    """Thread pool shared by the organize copies; created on first use"""
+    return ThreadPoolExecutor(max_workers=min(16, (os.cpu_count() or 1) * 4))
+
+def copy_one(file_info, target_prefix):
+    """Copy one scanned file to target_prefix + its name, returning (ok, name, error)
+    
+    target_prefix is the target directory with a trailing separator, built once
+    per group. On the same filesystem the "copy" is a hardlink, so organizing
+    moves no image data and takes no extra space; the original stays where it was.
+    """
+    name = file_info["name"]
+    try:
+        link_or_copy(file_info["path"], target_prefix + name)
+        return True, name, None
+    except Exception as e:
+        return False, name, e
+
+def make_group_dir(path):
+    """Create one group directory under a base directory that already exists
+    
+    Unlike os.makedirs this doesn't walk the parents again for every group.
+    """
+    try:
+        os.mkdir(path)
+    except FileExistsError:
+        if not os.path.isdir(path):
+            raise
+
+def _link_files_into(files, target_dir):
+    """Link or copy scanned files into target_dir concurrently
+    
+    Each copy mostly waits on IO, so they share the copy_executor() pool.
+    Returns (number copied, list of "name: error" lines for the failures).
+    """
+    done = 0
+    errors = []
+    target_prefix = target_dir + os.sep
+    futures = [copy_executor().submit(copy_one, file_info, target_prefix) for file_info in files]
+    for future in as_completed(futures):
+        ok, name, error = future.result()
+        if ok:
+            done += 1
+        else:
+            errors.append(f"  {name}: {error}\n")
+    return done, errors
+
+def report_copy_errors(errors):
+    """Print a group's copy failures together rather than one write per file"""
+    if errors:
+        print_styled(RED, f"Error copying {len(errors)} files:")
+        sys.stdout.write("".join(errors))
 
 def organize_by_groups(groups, group_type):
     """Organize images into subdirectories based on group data"""
@@ -2561,34 +2761,25 @@ def organize_by_groups(groups, group_type):
     print()
     print_styled(BOLD, f"Organizing {len(groups_to_organize)} groups...")
     
-    import shutil
     total_moved = 0
+    os.makedirs(base_dir, exist_ok=True)
     
     for group_name, files in groups_to_organize:
         # Create sanitized directory name
-        dir_name = re.sub(r'[^\w\-_]', '_', group_name)
+        dir_name = UNSAFE_DIR_CHARS.sub('_', group_name)
         target_dir = os.path.join(base_dir, dir_name)
         
         # Create directory
-        os.makedirs(target_dir, exist_ok=True)
+        make_group_dir(target_dir)
         
-        # Move files
-        moved = 0
-        for file_info in files:
-            source_path = file_info["path"]
-            target_path = os.path.join(target_dir, os.path.basename(source_path))
-            
-            try:
-                shutil.copy2(source_path, target_path)
-                moved += 1
-                total_moved += 1
-            except Exception as e:
-                print_styled(RED, f"Error copying {os.path.basename(source_path)}: {e}")
+        moved, errors = _link_files_into(files, target_dir)
+        total_moved += moved
+        report_copy_errors(errors)
         
         print_styled(GREEN, f"✓ Group '{group_name}': moved {moved}/{len(files)} files to {target_dir}")
     
     print()
-    print_styled(BOLD + GREEN, f"Successfully organized {total_moved} files into {len(groups_to_organize)} directories")
+    print_styled(BOLD_GREEN, f"Successfully organized {total_moved} files into {len(groups_to_organize)} directories")
     print_styled(GRAY, f"Files remain in the original location and can now be used for batch processing")
 
 def organize_equal_groups(files, num_groups):
@@ -2622,31 +2813,22 @@ def organize_equal_groups(files, num_groups):
     print()
     print_styled(BOLD, f"Organizing into {num_groups} equal groups...")
     
-    import shutil
     total_moved = 0
+    os.makedirs(base_dir, exist_ok=True)
     
     for i, group_files in enumerate(groups, 1):
         # Create directory
         target_dir = os.path.join(base_dir, f"group_{i:02d}")
-        os.makedirs(target_dir, exist_ok=True)
+        make_group_dir(target_dir)
         
-        # Move files
-        moved = 0
-        for file_info in group_files:
-            source_path = file_info["path"]
-            target_path = os.path.join(target_dir, os.path.basename(source_path))
-            
-            try:
-                shutil.copy2(source_path, target_path)
-                moved += 1
-                total_moved += 1
-            except Exception as e:
-                print_styled(RED, f"Error copying {os.path.basename(source_path)}: {e}")
+        moved, errors = _link_files_into(group_files, target_dir)
+        total_moved += moved
+        report_copy_errors(errors)
         
         print_styled(GREEN, f"✓ Group {i}: moved {moved}/{len(group_files)} files to {target_dir}")
     
     print()
-    print_styled(BOLD + GREEN, f"Successfully organized {total_moved} files into {num_groups} directories")
+    print_styled(BOLD_GREEN, f"Successfully organized {total_moved} files into {num_groups} directories")
     print_styled(GRAY, f"Files remain in the original location and can now be used for batch processing")
 
 def view_media_info():
@@ -2657,20 +2839,20 @@ def view_media_info():
     print()
     
     # Show spinner while scanning
-    show_spinner("Scanning media files", 1)
-    
-    # Scan all directories
-    images_original = smart_scan_directory("images/original", IMAGE_EXTENSIONS)
-    audio_files = smart_scan_directory("song", AUDIO_EXTENSIONS)
-    
-    # Check images in subdirectories
-    image_subdirs = []
-    if os.path.exists("images"):
-        for item in os.listdir("images"):
-            full_path = os.path.join("images", item)
-            if os.path.isdir(full_path) and item != "original":
-                # Check if this directory has images
-                subdir_images = smart_scan_directory(full_path, IMAGE_EXTENSIONS)
+    with Spinner("Scanning media files"):
+        # Scan all directories
+        images_original = smart_scan_directory("images/original", IMAGE_EXTENSIONS)
+        audio_files = smart_scan_directory("song", AUDIO_EXTENSIONS)
+        
+        # Check images in subdirectories
+        image_subdirs = []
+        if os.path.exists("images"):
+            with os.scandir("images") as entries:
+                subdirs = [entry.name for entry in entries if entry.is_dir() and entry.name != "original"]
+            for item in subdirs:
+                full_path = os.path.join("images", item)
+                # Only the image count is shown, so skip the grouping work
+                subdir_images = smart_scan_directory(full_path, IMAGE_EXTENSIONS, quick=True)
                 if subdir_images["count"] > 0:
                     image_subdirs.append({
                         "name": item,
@@ -2679,7 +2861,7 @@ def view_media_info():
                     })
     
     # Main images directory
-    print_styled(BOLD + CYAN, "Main Images Directory:")
+    print_styled(BOLD_CYAN, "Main Images Directory:")
     if images_original["count"] > 0:
         print_styled(GREEN, f"✓ Found {images_original['count']} images in images/original/")
         
@@ -2703,13 +2885,13 @@ def view_media_info():
     # Image subdirectories
     if image_subdirs:
         print()
-        print_styled(BOLD + CYAN, "Image Subdirectories:")
+        print_styled(BOLD_CYAN, "Image Subdirectories:")
         for subdir in image_subdirs:
             print_styled(GREEN, f"✓ {subdir['name']}: {subdir['data']['count']} images")
     
     # Audio files
     print()
-    print_styled(BOLD + CYAN, "Audio Files:")
+    print_styled(BOLD_CYAN, "Audio Files:")
     if audio_files["count"] > 0:
         print_styled(GREEN, f"✓ Found {audio_files['count']} audio files in song/ directory")
         
@@ -2721,26 +2903,31 @@ def view_media_info():
                 print_styled(GRAY, f"    {ext}: {len(files)} files")
                 
         # Show audio durations if possible
-        audio_list = [f for f in audio_files["files"] if f["type"] == "audio"]
-        if audio_list:
+        # Only the first 5 are shown for brevity, so only those are collected
+        audio_iter = (f for f in audio_files["files"] if f["type"] == "audio")
+        shown = list(itertools.islice(audio_iter, 5))
+        if shown:
             print_styled(GRAY, "  Audio details:")
-            for i, file_info in enumerate(audio_list[:5], 1):  # Show only first 5 for brevity
-                duration = get_audio_duration(file_info["path"])
+            # Each duration is an ffprobe launch, so probe them all at once
+            with ThreadPoolExecutor(max_workers=len(shown)) as executor:
+                durations = list(executor.map(get_audio_duration, [f["path"] for f in shown]))
+            for i, (file_info, duration) in enumerate(zip(shown, durations), 1):
                 if duration:
                     mins, secs = divmod(duration, 60)
                     print_styled(GRAY, f"    {i}. {file_info['name']}: {int(mins)}:{int(secs):02d}")
                 else:
                     print_styled(GRAY, f"    {i}. {file_info['name']}")
             
-            if len(audio_list) > 5:
-                print_styled(GRAY, f"    ... and {len(audio_list) - 5} more")
+            more = sum(1 for _ in audio_iter)
+            if more:
+                print_styled(GRAY, f"    ... and {more} more")
     else:
         print_styled(YELLOW, "⚠️ No audio files found in song/ directory")
     
     # Show suggested slideshow configurations
     if images_original["count"] > 0:
         print()
-        print_styled(BOLD + CYAN, "Suggested Configurations:")
+        print_styled(BOLD_CYAN, "Suggested Configurations:")
         
         # Find best matching audio
         best_audio = find_matching_audio(images_original, audio_files)
@@ -2771,12 +2958,40 @@ def view_media_info():
             print_styled(CYAN, f"  - Suggested slide duration: 3.00 seconds (default)")
             print_styled(CYAN, f"  - Total slideshow duration: {3.0 * images_original['count']:.2f} seconds")
     
-    input("\nPress Enter to return to the menu...")
+    wait_for_key("\nPress Enter to return to the menu...")
 
 def get_audio_duration(audio_path):
-    """Get the duration of an audio file using FFmpeg"""
+    """Get the duration of an audio file, remembering it for the session"""
+    try:
+        st = os.stat(audio_path)
+    except OSError:
+        return None
+    
+    key = (audio_path, st.st_mtime_ns, st.st_size)
+    if key not in _AUDIO_DURATIONS:
+        _AUDIO_DURATIONS[key] = probe_audio_duration(audio_path)
+    return _AUDIO_DURATIONS[key]
+
+def probe_audio_duration(audio_path):
+    """Read the duration of an audio file
+    
+    TinyTag reads it from the file header in-process when installed; FFmpeg's
+    ffprobe covers everything else.
+    """
+    if HAVE_TINYTAG:
+        try:
+            duration = TinyTag.get(audio_path).duration
+            if duration:
+                return float(duration)
+        except Exception:
+            pass
+    
+    ffprobe = find_tool("ffprobe")
+    if ffprobe is None:
+        return None
+    
     try:
-        process = subprocess.run(['ffprobe', '-v', 'error', '-show_entries', 'format=duration', '-of', 
+        process = subprocess.run([ffprobe, '-v', 'error', '-show_entries', 'format=duration', '-of', 
                                'default=noprint_wrappers=1:nokey=1', audio_path], 
                                capture_output=True, text=True, check=True)
         duration = float(process.stdout.strip())
@@ -2789,42 +3004,58 @@ def find_matching_audio(images_data, audio_data):
     if not audio_data or audio_data["count"] == 0:
         return None
     
-    # Get all audio files
-    audio_files = [f["path"] for f in audio_data["files"] if f["type"] == "audio"]
+    # Get all audio files; the scan already recorded each file's name
+    audio_files = [(f["path"], f["name"]) for f in audio_data["files"] if f["type"] == "audio"]
     if not audio_files:
         return None
     
     # If we only have one audio file, return it
     if len(audio_files) == 1:
-        return audio_files[0]
+        return audio_files[0][0]
+    
+    # Match by the images' most common date, else by their largest prefix group
+    date_sizes = images_data["groups"]["date_sizes"]
+    prefix_groups = images_data["groups"]["prefix"]
+    most_common_date = date_sizes.most_common(1)[0][0] if date_sizes else None
+    prefix = max(prefix_groups.items(), key=lambda x: len(x[1]))[0] if prefix_groups else None
+    
+    # One pass over the audio files: a date match wins outright, otherwise the
+    # first prefix match is used
+    prefix_match = None
+    for audio_file, audio_name in audio_files:
+        if most_common_date and most_common_date in audio_name:
+            return audio_file
+        if prefix_match is None and prefix and prefix in audio_name:
+            prefix_match = audio_file
     
-    # If we have date-based image groups, try to match audio files by date
-    if images_data["groups"]["date"]:
-        # Get the most common date
-        most_common_date = max(images_data["groups"]["date"].values(), key=len)[0]["date"]
-        
-        # Try to find audio files with matching date in filename
-        for audio_file in audio_files:
-            audio_name = os.path.basename(audio_file)
-            if most_common_date in audio_name:
-                return audio_file
+    # Default to the first audio file
+    return prefix_match or audio_files[0][0]
+
+def smart_scan_directory(directory, extensions, filenames=None, quick=False):
+    """Scan a directory for files and organize them into groups
     
-    # If we have a prefix group, try to match by prefix
-    if images_data["groups"]["prefix"]:
-        largest_prefix_group = max(images_data["groups"]["prefix"].items(), key=lambda x: len(x[1]))
-        prefix = largest_prefix_group[0]
-        
-        # Try to find audio files with similar prefix
-        for audio_file in audio_files:
-            audio_name = os.path.basename(audio_file)
-            if prefix in audio_name:
-                return audio_file
+    If filenames is given, only those files in the directory are grouped and
+    the directory itself is not listed. With quick=True only "count" is filled
+    in, skipping the grouping.
+    """
+    if quick:
+        try:
+            with os.scandir(directory) as entries:
+                count = sum(1 for entry in entries
+                            if not entry.name.startswith('.') and not entry.is_dir()
+                            and os.path.splitext(entry.name)[1].lower() in extensions)
+        except (FileNotFoundError, NotADirectoryError):
+            count = 0
+        return {
+            "count": count,
+            "files": [],
+            "groups": {"date": {}, "prefix": {}, "sequence": {}, "extension": {}, "date_sizes": Counter()}
+        }
     
-    # Default to the first audio file
-    return audio_files[0]
+    return group_media_files(directory, extensions, filenames)
 
-def smart_scan_directory(directory, extensions):
-    """Scan a directory for files and organize them into groups"""
+def group_media_files(directory, extensions, filenames=None):
+    """Group the media files of a directory (or the given filenames in it)"""
     result = {
         "count": 0,
         "files": [],
@@ -2832,24 +3063,40 @@ def smart_scan_directory(directory, extensions):
             "date": {},
             "prefix": {},
             "sequence": {},
-            "extension": {}
+            "extension": {},
+            "date_sizes": Counter()  # Files per date, for most_common()
         }
     }
     
-    # Check if directory exists
-    if not os.path.exists(directory):
-        return result
+    if filenames is None:
+        # List the files, skipping directories; DirEntry caches the file type
+        # from the directory listing, so no extra stat is needed per file.
+        # A missing directory just means an empty result
+        try:
+            with os.scandir(directory) as entries:
+                filenames = [entry.name for entry in entries if not entry.is_dir()]
+        except (FileNotFoundError, NotADirectoryError):
+            return result
+    
+    # Group into defaultdicts (a single append per file), returned as plain dicts
+    groups = {key: defaultdict(list) for key in ("date", "prefix", "sequence", "extension")}
+    date_groups = groups["date"]
+    prefix_groups = groups["prefix"]
+    sequence_groups = groups["sequence"]
+    extension_groups = groups["extension"]
+    date_sizes = result["groups"]["date_sizes"]
     
     # Scan for files with the requested extensions
-    for filename in os.listdir(directory):
-        file_path = os.path.join(directory, filename)
-        
-        # Skip directories and hidden files
-        if os.path.isdir(file_path) or filename.startswith('.'):
+    for filename in filenames:
+        # Skip hidden files
+        if filename.startswith('.'):
             continue
         
-        # Check file extension
-        ext = os.path.splitext(filename)[1].lower()
+        file_path = os.path.join(directory, filename)
+        
+        # Check file extension (the stem is kept for the prefix fallback)
+        stem, ext = os.path.splitext(filename)
+        ext = ext.lower()
         if ext not in extensions:
             continue
         
@@ -2874,70 +3121,52 @@ def smart_scan_directory(directory, extensions):
         result["count"] += 1
         
         # Add to extension group
-        if ext not in result["groups"]["extension"]:
-            result["groups"]["extension"][ext] = []
-        result["groups"]["extension"][ext].append(file_info)
+        extension_groups[ext].append(file_info)
         
         # Skip the rest for non-image files
         if file_type != "image":
             continue
         
-        # Extract date from filename
-        date_found = False
-        for pattern in DATE_PATTERNS:
-            match = re.search(pattern, filename)
-            if match:
-                date_str = match.group(1)
-                if date_str not in result["groups"]["date"]:
-                    result["groups"]["date"][date_str] = []
-                
-                file_info["date"] = date_str
-                result["groups"]["date"][date_str].append(file_info)
-                date_found = True
-                break
+        # Extract date and sequence number in one pass over the filename
+        parts = FILENAME_PATTERN.match(filename).groups()
+        date_str = next(filter(None, parts[:DATE_GROUP_COUNT]), None)
+        seq_num = next(filter(None, parts[DATE_GROUP_COUNT:]), None)
         
-        # Extract sequence number
-        sequence_found = False
-        for pattern in SEQUENCE_PATTERNS:
-            match = re.search(pattern, filename)
-            if match:
-                seq_num = match.group(1)
-                
-                # Find common prefix (part before the sequence number)
-                prefix_parts = filename.split(seq_num, 1)
-                if len(prefix_parts) == 2:
-                    prefix = prefix_parts[0]
-                    
-                    # Add to sequence group
-                    if prefix not in result["groups"]["sequence"]:
-                        result["groups"]["sequence"][prefix] = []
-                    
-                    file_info["sequence"] = {
-                        "prefix": prefix,
-                        "number": int(seq_num)
-                    }
-                    
-                    result["groups"]["sequence"][prefix].append(file_info)
-                    sequence_found = True
-                    break
-        
-        # Extract prefix (first part of the filename)
-        if not sequence_found:
-            # Use first word/segment as prefix
-            name_parts = re.split(r'[-_\s]', os.path.splitext(filename)[0], 1)
+        if date_str:
+            file_info["date"] = date_str
+            date_groups[date_str].append(file_info)
+            date_sizes[date_str] += 1
+        
+        # Group by sequence number
+        if seq_num:
+            # Find common prefix (part before the sequence number)
+            prefix = filename.split(seq_num, 1)[0]
+            
+            file_info["sequence"] = {
+                "prefix": prefix,
+                "number": int(seq_num)
+            }
+            
+            # Add to sequence group
+            sequence_groups[prefix].append(file_info)
+        else:
+            # Extract prefix (first word/segment of the filename)
+            name_parts = PREFIX_SEPARATOR.split(stem, 1)
             if len(name_parts) > 1:
                 prefix = name_parts[0]
-                
-                if prefix not in result["groups"]["prefix"]:
-                    result["groups"]["prefix"][prefix] = []
-                
                 file_info["prefix"] = prefix
-                result["groups"]["prefix"][prefix].append(file_info)
+                prefix_groups[prefix].append(file_info)
     
+    result["groups"] = {key: dict(group) for key, group in groups.items()}
+    result["groups"]["date_sizes"] = date_sizes
     return result
 
-def auto_organize_images(recursive=False):
-    """Automatically analyze and organize images and audio files"""
+def auto_organize_images(recursive=False, image_paths=None):
+    """Automatically analyze and organize images and audio files
+    
+    Pass image_paths when the contents of images/original are already known
+    (e.g. just created) to skip rescanning that directory.
+    """
     result = {
         "images": {
             "count": 0,
@@ -2961,7 +3190,8 @@ def auto_organize_images(recursive=False):
     }
     
     # Scan images directory
-    images_data = smart_scan_directory("images/original", IMAGE_EXTENSIONS)
+    image_names = None if image_paths is None else [os.path.basename(path) for path in image_paths]
+    images_data = smart_scan_directory("images/original", IMAGE_EXTENSIONS, image_names)
     
     # Update result with image data
     result["images"]["count"] = images_data["count"]
@@ -2983,14 +3213,16 @@ def auto_organize_images(recursive=False):
         # If no sequence found, try to use date
         if not has_sequence and images_data["groups"]["date"]:
             # Find the largest date group
-            largest_date_group = max(images_data["groups"]["date"].values(), key=len)
+            most_common_date = images_data["groups"]["date_sizes"].most_common(1)[0][0]
+            largest_date_group = images_data["groups"]["date"][most_common_date]
             if len(largest_date_group) > 1:
                 # Sort by name within the same date
                 sorted_files = sorted(largest_date_group, key=lambda x: x["name"])
                 result["images"]["suggested_order"] = [file_info["path"] for file_info in sorted_files]
                 
-                # Add remaining files
-                remaining = [f for f in images_data["files"] if f["path"] not in result["images"]["suggested_order"]]
+                # Add remaining files (set lookup keeps this linear for large photo sets)
+                ordered_paths = set(result["images"]["suggested_order"])
+                remaining = [f for f in images_data["files"] if f["path"] not in ordered_paths]
                 remaining_sorted = sorted(remaining, key=lambda x: x["name"])
                 result["images"]["suggested_order"].extend([file_info["path"] for file_info in remaining_sorted])
             else:
@@ -3033,7 +3265,7 @@ def auto_organize_images(recursive=False):
 
 def main():
     """Main function"""
-    global USE_COLORS, USE_UNICODE, USE_ANIMATIONS
+    global USE_COLORS, USE_UNICODE, USE_ANIMATIONS, print_styled, PROMPT_FORMAT
     
     # Parse command line arguments
     args = parse_args()
@@ -3048,6 +3280,14 @@ def main():
     USE_UNICODE = not args.no_unicode
     USE_ANIMATIONS = not args.no_animations
     
+    # Pick the print_styled variant once instead of checking USE_COLORS per call
+    print_styled = _print_styled_color if USE_COLORS else _print_styled_plain
+    if not USE_COLORS:
+        PROMPT_FORMAT = "{}"
+    
+    # Avoid re-querying the terminal size on every redraw
+    watch_terminal_size()
+    
     # Run hardware analysis if requested
     if args.hardware_analysis:
         run_hardware_analysis()
@@ -3067,7 +3307,7 @@ def main():
     show_main_menu()
 
 def create_test_images():
-    """Create sample test images for demo purposes"""
+    """Create sample test images for demo purposes and return their paths"""
     print_styled(CYAN, "Creating test images...")
     
     # Ensure directories exist
@@ -3097,6 +3337,7 @@ def create_test_images():
         font = None
     
     # Create images
+    image_paths = []
     for i in range(1, 11):
         img = Image.new('RGB', (800, 600), colors[i-1])
         draw = ImageDraw.Draw(img)
@@ -3118,6 +3359,7 @@ def create_test_images():
         # Save image
         img_path = os.path.join("images/original", f"test{i}.jpg")
         img.save(img_path)
+        image_paths.append(img_path)
     
     # Create a test audio file
     try:
@@ -3127,10 +3369,10 @@ def create_test_images():
             f.write("This is a placeholder for a real MP3 file.")
         
         print_styled(GREEN, f"✓ Created 10 test images and a placeholder audio file")
-        return True
     except Exception as e:
         print_styled(RED, f"Error creating test audio: {e}")
-        return False
+    
+    return image_paths
 
 if __name__ == "__main__":
     try:
@@ -54,6 +54,9 @@ RED = "\033[38;5;196m"
 CYAN = "\033[38;5;87m"
 PURPLE = "\033[38;5;141m"
 
+# Units used by format_bytes, one per power of 1024
+BYTE_UNITS = ('B', 'KB', 'MB', 'GB', 'TB')
+
 # Accessibility options
 USE_COLORS = True
 USE_UNICODE = True
@@ -66,6 +69,14 @@ def print_styled(style, text):
     else:
         print(text)
 
+def clear_screen():
+    """Clear the terminal and its scrollback, writing the escape directly outside Windows"""
+    if os.name == 'nt':
+        os.system('cls')
+    else:
+        sys.stdout.write("\033[H\033[2J\033[3J")
+        sys.stdout.flush()
+
 def draw_divider():
     """Draw a horizontal divider line"""
     width = shutil.get_terminal_size().columns
@@ -521,10 +532,9 @@ def format_bytes(bytes_value):
     if bytes_value is None:
         return "Unknown"
     
-    for unit in ['B', 'KB', 'MB', 'GB', 'TB']:
-        if bytes_value < 1024 or unit == 'TB':
-            return f"{bytes_value:.2f} {unit}"
-        bytes_value /= 1024
+    # Each unit step is 10 bits, so the bit length picks the unit directly
+    index = min((max(int(bytes_value), 1).bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+    return f"{bytes_value / (1 << (index * 10)):.2f} {BYTE_UNITS[index]}"
 
 def display_results(results):
     """Display hardware analysis results in a user-friendly format"""
@@ -536,7 +546,7 @@ def display_results(results):
     benchmarks = results['benchmarks']
     
     # Clear the screen and show header
-    os.system('cls' if os.name == 'nt' else 'clear')
+    clear_screen()
     center_text(f"{PROGRAM_NAME} - Hardware Analysis")
     print_styled(GRAY, f"Version {VERSION} | {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
     draw_divider()
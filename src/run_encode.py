@@ -0,0 +1,322 @@
+#!/usr/bin/env python3
+# SlideSonic (2025) - Encoding Script - MAXIMUM SPEED OPTIMIZATION
+# https://github.com/chama-x/SlideSonic-2025
+#
+# Reads the slideshow settings written by create_encoding_script() in
+# advanced_app.py. Usage: run_encode.py [config.json]
+#
+# build_encode() and write_work_files() can also be imported, so callers that
+# don't need this script's console output can start FFmpeg themselves.
+
+import os
+import sys
+import time
+import subprocess
+from datetime import datetime
+import json
+
+try:
+    import orjson
+    HAVE_ORJSON = True
+except ImportError:
+    HAVE_ORJSON = False
+
+FRAME_RATE = 25  # FFmpeg's default output rate for image input
+
+def load_config(config_file):
+    """Read the slideshow settings written by create_encoding_script()"""
+    with open(config_file, "rb") as f:
+        data = f.read()
+    return orjson.loads(data) if HAVE_ORJSON else json.loads(data)
+
+def build_encode(config, log=print):
+    """
+    Work out everything one encode needs from its settings.
+    Returns (ffmpeg_cmd, filelist_text, metadata); progress notes go to log.
+    """
+    title = config["title"]
+    resolution = config["resolution"]
+    quality_preset = config["quality"]  # Using ultrafast preset for maximum speed
+    output_filename = config["output_filename"]
+    encoder = config["encoder"]
+    audio_file = config["audio_file"]
+    # Batch jobs each get their own directory so parallel encodes don't collide
+    work_dir = config.get("work_dir", "temp")
+    filelist_file = os.path.join(work_dir, "filelist.txt")
+    
+    # Print optimization info
+    log("SPEED OPTIMIZATION: Using maximum speed settings")
+    log(f"ENCODER: {encoder} with PRESET: {quality_preset}")
+    
+    # Using smart-sorted image list
+    image_files = config["images"]
+    log(f"Using {len(image_files)} images in optimized order")
+    
+    # Calculate duration per slide based on audio duration
+    audio_duration = None
+    if audio_file:
+        try:
+            cmd = ['ffprobe', '-v', 'error', '-show_entries', 'format=duration',
+                   '-of', 'default=noprint_wrappers=1:nokey=1', audio_file]
+            audio_duration = float(subprocess.check_output(cmd, text=True).strip())
+            log(f"Audio duration: {audio_duration:.2f} seconds")
+        except (subprocess.SubprocessError, ValueError):
+            log("Warning: Could not determine audio duration")
+    
+    # Use provided slide duration or calculate from audio
+    slide_duration = config["slide_duration"]
+    if audio_duration:
+        # Make sure slides fit within audio, adjusting if necessary
+        total_duration = slide_duration * len(image_files)
+        if total_duration < audio_duration * 0.9:  # If much shorter than audio
+            # Can lengthen slide duration to better use the audio
+            slide_duration = min(6.0, audio_duration / len(image_files))
+            log(f"Adjusted slide duration to {slide_duration:.2f}s to better match audio")
+    
+    log(f"Using slide duration: {slide_duration:.2f} seconds")
+    
+    # Resolve every image once; bare filenames live in images/original, whose
+    # absolute path is worked out a single time
+    originals_dir = os.path.abspath("images/original")
+    image_paths = [os.path.abspath(img) if os.path.dirname(img) else os.path.join(originals_dir, img)
+                   for img in image_files]
+    
+    # Build the file list in one string; the last image is listed again to
+    # avoid premature ending
+    filelist = "".join(f"file '{path}'\nduration {slide_duration}\n" for path in image_paths)
+    filelist += f"file '{image_paths[-1]}'\n"
+    
+    # Determine quality settings based on encoder
+    crf_value = "30"  # Higher CRF = lower quality but faster encoding
+    if encoder == "libx265":
+        crf_value = "35"  # HEVC uses different CRF scale - much higher for speed
+    elif "av1" in encoder:
+        crf_value = "40"  # AV1 uses different CRF scale - much higher for speed
+    
+    # Slides are still images, so start each one on a keyframe and let the
+    # frames in between become near-free references to it
+    slide_frames = max(1, round(slide_duration * FRAME_RATE))
+    
+    # Build FFmpeg command with maximum speed optimizations
+    # Let the scale (and any upload) filters run on every core, not just one
+    filter_threads = str(os.cpu_count() or 1)
+    ffmpeg_cmd = [
+        "ffmpeg", "-y",
+        "-filter_threads", filter_threads,
+        "-filter_complex_threads", filter_threads,
+        "-fflags", "+genpts",
+        "-f", "concat", "-safe", "0", "-i", filelist_file,
+    ]
+    
+    # Add audio if available
+    if audio_file:
+        ffmpeg_cmd.extend(["-i", audio_file])
+    
+    # VA-API needs its render device opened before any input
+    if "vaapi" in encoder:
+        ffmpeg_cmd[2:2] = ["-vaapi_device", "/dev/dri/renderD128"]
+    
+    # Add video settings optimized for speed
+    ffmpeg_cmd.extend([
+        "-c:v", encoder,
+        "-r", str(FRAME_RATE),
+        "-g", str(slide_frames),           # One keyframe per slide
+        "-keyint_min", str(slide_frames),
+        "-sc_threshold", "0",     # Disable scene change detection for speed
+        # Optimize for decode speed (and static content on libx264)
+        "-tune", "stillimage,fastdecode" if encoder == "libx264" else "fastdecode",
+    ])
+    
+    # VA-API frames are uploaded as nv12 surfaces by the filter chain instead
+    if "vaapi" not in encoder:
+        ffmpeg_cmd.extend(["-pix_fmt", "yuv420p"])
+    
+    # Additional encoder-specific optimizations for speed
+    if "videotoolbox" in encoder:
+        # Apple VideoToolbox specific optimizations for speed
+        ffmpeg_cmd.extend([
+            "-allow_sw", "1",       # Allow software fallback
+            "-realtime", "1",       # Prioritize realtime encoding
+            "-b:v", "1M",           # Use fixed bitrate mode for speed
+            "-maxrate", "1M",       # Limit max bitrate
+            "-bufsize", "1M",       # Small buffer for speed
+        ])
+    elif "nvenc" in encoder:
+        # NVIDIA NVENC specific optimizations for speed
+        ffmpeg_cmd.extend([
+            "-preset", "p1",         # Fastest preset for NVENC
+            "-tune", "ll",           # Low latency tuning
+            "-rc", "constqp",        # Constant QP mode for speed
+            "-qp", "32",             # Higher QP = faster encoding
+            "-b:v", "0",             # Disable bitrate control
+        ])
+    elif "qsv" in encoder:
+        # Intel QuickSync specific optimizations
+        ffmpeg_cmd.extend([
+            "-global_quality", crf_value,  # QSV's constant-quality control
+            "-look_ahead", "0",     # No lookahead for speed
+            "-low_power", "1",      # Use low power mode for speed
+            "-async_depth", "1",    # Minimize frame queue
+        ])
+    elif "vaapi" in encoder:
+        # VA-API takes a constant QP rather than CRF
+        ffmpeg_cmd.extend([
+            "-qp", crf_value,
+        ])
+    else:
+        # Software encoder optimizations
+        ffmpeg_cmd.extend([
+            "-preset", quality_preset,
+            "-crf", crf_value,
+            "-threads", "0",         # Use all available threads
+            "-slices", "4",          # Slice frames for parallel encoding
+            "-flags", "+cgop",       # Closed GOP for faster encoding
+            "-movflags", "+faststart", # Optimize for streaming
+            "-write_tmcd", "0",      # No timecode track for still images
+            "-bf", "0",              # No B-frames for speed
+            "-refs", "1",            # Minimal reference frames
+        ])
+        if encoder == "libx264":
+            # Keep x264's own GOP logic from overriding the per-slide keyframes
+            ffmpeg_cmd.extend([
+                "-x264-params", f"scenecut=0:keyint={slide_frames}:min-keyint={slide_frames}",
+            ])
+    
+    # Add fast audio encoding settings if available
+    if audio_file:
+        ffmpeg_cmd.extend([
+            "-c:a", "aac",
+            "-b:a", "128k",         # Lower audio bitrate for speed
+            "-ar", "44100",         # Lower sample rate for speed
+        ])
+    
+    # Optimize filter settings for speed
+    video_filter = f"scale={resolution}:flags=fast_bilinear"  # Fast scaling algorithm
+    if "vaapi" in encoder:
+        # Hand frames to the GPU in the surface format the encoder expects
+        video_filter += ",format=nv12,hwupload"
+    
+    ffmpeg_cmd.extend([
+        "-vf", video_filter,
+        "output/" + output_filename
+    ])
+    
+    # Metadata about the encoding
+    metadata = {
+        "title": title,
+        "created": datetime.now().isoformat(),
+        "settings": {
+            "resolution": resolution,
+            "quality": quality_preset,
+            "encoder": encoder,
+            "slide_duration": slide_duration,
+            "total_duration": slide_duration * len(image_files),
+            "image_count": len(image_files),
+            "audio": audio_file is not None
+        }
+    }
+    
+    return ffmpeg_cmd, filelist, metadata
+
+def write_work_files(config, filelist, metadata):
+    """Write the FFmpeg file list and the encode metadata to the job's work directory"""
+    work_dir = config.get("work_dir", "temp")
+    os.makedirs(work_dir, exist_ok=True)
+    os.makedirs("output", exist_ok=True)
+    
+    with open(os.path.join(work_dir, "filelist.txt"), "w") as f:
+        f.write(filelist)
+    
+    # Written compactly; the monitor is its only reader
+    if HAVE_ORJSON:
+        with open(os.path.join(work_dir, "encode_metadata.json"), "wb") as f:
+            f.write(orjson.dumps(metadata))
+    else:
+        with open(os.path.join(work_dir, "encode_metadata.json"), "w") as f:
+            json.dump(metadata, f, separators=(",", ":"))
+
+def main():
+    """Encode the slideshow described by the settings file"""
+    # Settings file, relative to the project directory the encode runs in
+    config_file = sys.argv[1] if len(sys.argv) > 1 else "temp/encode_config.json"
+    
+    try:
+        config = load_config(config_file)
+    except (OSError, ValueError) as e:
+        print(f"Error: Could not read encoding settings from {config_file}: {e}")
+        return 1
+    
+    if not config["images"]:
+        print("Error: No images found in images/original/ directory")
+        return 1
+    
+    ffmpeg_cmd, filelist, metadata = build_encode(config)
+    write_work_files(config, filelist, metadata)
+    work_dir = config.get("work_dir", "temp")
+    output_filename = config["output_filename"]
+    
+    # Log the command
+    print(f"Running FFmpeg command: {' '.join(ffmpeg_cmd)}")
+    
+    # Create log file - IMPORTANT: This must match the path expected by monitor_encoding.py
+    log_file = os.path.join(work_dir, "ffmpeg_output.log")
+    
+    # Run FFmpeg
+    try:
+        # First, create a subprocess that runs FFmpeg and redirects output to a log file
+        print(f"Starting encoding process...")
+        print(f"For detailed progress, you can view the log file: {log_file}")
+        
+        # Open log file for FFmpeg output
+        log_file_handle = open(log_file, "w")
+        
+        # Start the FFmpeg process
+        process = subprocess.Popen(
+            ffmpeg_cmd,
+            stdout=log_file_handle,
+            stderr=subprocess.STDOUT,
+            universal_newlines=True
+        )
+        
+        # Record start time
+        start_time = time.time()
+        
+        # Write the PID to a file for the monitor to pick up
+        with open(os.path.join(work_dir, "ffmpeg_pid.txt"), "w") as f:
+            f.write(str(process.pid))
+        
+        # Wait for the process to complete
+        process.wait()
+        returncode = process.returncode
+        
+        # Calculate elapsed time
+        elapsed_time = time.time() - start_time
+        
+        # Close log file
+        log_file_handle.close()
+        
+        # Final output based on success or failure
+        if returncode == 0:
+            print(f"\n\033[38;5;35m✓\033[0m \033[1mEncoding completed successfully\033[0m in {elapsed_time:.2f} seconds")
+            print(f"Output: output/{output_filename}")
+            
+            # Show file size
+            try:
+                file_size = os.path.getsize("output/" + output_filename)
+                print(f"File size: {file_size / (1024*1024):.2f} MB")
+            except OSError:
+                pass
+        else:
+            print(f"\n\033[38;5;196m✗\033[0m \033[1mEncoding failed\033[0m with code {returncode}")
+            print(f"Check log file for details: {log_file}")
+    except Exception as e:
+        print(f"Error running FFmpeg: {e}")
+        if 'log_file_handle' in locals() and not log_file_handle.closed:
+            log_file_handle.close()
+        returncode = 1
+    
+    # Report FFmpeg's result to whoever launched this script
+    return returncode
+
+if __name__ == "__main__":
+    sys.exit(main())